@@ -0,0 +1,131 @@
+import contextlib
+import importlib.util
+import os
+import httpx
+import orjson
+from openai import AsyncOpenAI, AuthenticationError, PermissionDeniedError, DefaultAsyncHttpxClient
+from core.config import settings
+
+# One AsyncOpenAI client (and connection pool) for every agent in the process
+_openai_client = None
+_http_client = None
+
+
+def _build_http_client():
+    # HTTP/2 lets concurrent agent calls share one TLS connection; it needs
+    # the optional h2 package (httpx[http2]), so fall back to HTTP/1.1 pooling
+    return DefaultAsyncHttpxClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=256,
+            max_keepalive_connections=128,
+            # Outlive the keepalive ping interval so pooled connections survive it
+            keepalive_expiry=settings.LLM_KEEPALIVE_SECONDS * 2 or 5.0,
+        ),
+    )
+
+
+def get_openai_client(refresh=False):
+    """Return the shared AsyncOpenAI client, rebuilding it from the environment on refresh
+
+    A refresh only swaps the credentials; the underlying HTTP connection pool
+    is kept.
+    """
+    global _openai_client, _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _build_http_client()
+        refresh = True
+    if _openai_client is None or refresh:
+        _openai_client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=_http_client)
+    return _openai_client
+
+
+async def close_openai_client():
+    """Close the shared HTTP connection pool"""
+    global _openai_client, _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _openai_client = None
+    _http_client = None
+
+
+class FallbackResult(dict):
+    """Placeholder payload an agent returns when its LLM call fails"""
+
+
+class BaseAgent:
+    """Shared OpenAI plumbing for the multi-agent pipeline"""
+
+    # Keys every JSON reply must carry; checked by _call_llm
+    REQUIRED_KEYS = ()
+
+    def __init__(self):
+        self.model = "gpt-5"
+        # None leaves the provider default in place
+        self.temperature = None
+        # Shared asyncio.Semaphore bounding in-flight LLM calls; set by the owning service
+        self.llm_semaphore = None
+
+    @property
+    def client(self):
+        return get_openai_client()
+
+    async def warmup(self):
+        """Open the shared client's connection to the provider before the first request"""
+        # A metadata lookup sets up TCP/TLS without paying for a completion
+        try:
+            await self.client.models.retrieve(self.model, timeout=10)
+        except Exception as e:
+            print(f"LLM warmup failed: {str(e)}")
+
+    def _completion_kwargs(self, system_prompt, user_prompt):
+        kwargs = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            "response_format": {"type": "json_object"},
+        }
+        if self.temperature is not None:
+            kwargs["temperature"] = self.temperature
+        return kwargs
+
+    def _response_content(self, response):
+        content = response.choices[0].message.content
+        if content is None:
+            raise ValueError("No content received from OpenAI API")
+        return content
+
+    @staticmethod
+    def _check_keys(result, required_keys):
+        """Raise ValueError unless result is a JSON object holding every required key"""
+        if not isinstance(result, dict):
+            raise ValueError("LLM reply is not a JSON object")
+        missing = [key for key in required_keys if key not in result]
+        if missing:
+            raise ValueError(f"LLM reply is missing {', '.join(missing)}")
+
+    async def _call_llm(self, system_prompt, user_prompt, required_keys=None):
+        """Run a JSON-mode chat completion without blocking the event loop
+
+        Replies lacking any of required_keys (the agent's REQUIRED_KEYS by
+        default) raise ValueError, so the agent falls back instead of passing
+        on (and the step cache storing) an incomplete result.
+        """
+        if required_keys is None:
+            required_keys = self.REQUIRED_KEYS
+
+        kwargs = self._completion_kwargs(system_prompt, user_prompt)
+        async with self.llm_semaphore or contextlib.nullcontext():
+            try:
+                response = await self.client.chat.completions.create(**kwargs)
+            except (AuthenticationError, PermissionDeniedError):
+                # The key may have been rotated since the client was built:
+                # rebuild it from the environment and retry once
+                get_openai_client(refresh=True)
+                response = await self.client.chat.completions.create(**kwargs)
+        content = self._response_content(response)
+        result = orjson.loads(content)
+        self._check_keys(result, required_keys)
+        return result
@@ -1,16 +1,20 @@
-import json
-import os
-from openai import OpenAI
+from agents.base_agent import BaseAgent, FallbackResult
 from config.agent_config import LANGUAGE_CONFIGS
 
 
-class CulturalAdvisor:
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model = "gpt-5"
+class CulturalAdvisor(BaseAgent):
+    REQUIRED_KEYS = ("cultural_appropriateness",)
 
-    def analyze(self, source_text, initial_translation, target_language="swedish"):
+    async def analyze(self, source_text, initial_translation, target_language="swedish"):
         """Analyze cultural context and provide localization recommendations"""
+        system_prompt, user_prompt = self._build_prompts(source_text, initial_translation, target_language)
+        try:
+            return await self._call_llm(system_prompt, user_prompt)
+        except Exception as e:
+            return self._fallback(e)
+
+    def _build_prompts(self, source_text, initial_translation, target_language):
+        """Build the system and user prompts for the target language"""
 
         lang_config = LANGUAGE_CONFIGS.get(target_language, LANGUAGE_CONFIGS["swedish"])
         lang_name = lang_config["name"]
@@ -120,29 +124,15 @@ class CulturalAdvisor:
         Consider {lang_name} cultural values like {', '.join(cultural_aspects)}.
         Recommend adaptations for authentic {lang_name} communication style."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                response_format={"type": "json_object"},
-            )
-
-            content = response.choices[0].message.content
-            if content is None:
-                raise ValueError("No content received from OpenAI API")
-            result = json.loads(content)
-            return result
+        return system_prompt, user_prompt
 
-        except Exception as e:
-            return {
-                "cultural_appropriateness": "low",
-                "adaptations": [f"Cultural analysis failed: {str(e)}"],
-                "regional_notes": [],
-                "register_recommendations": "neutral",
-                "localization_suggestions": [],
-                "cultural_risks": ["Unable to assess cultural context"],
-                "target_audience_fit": "poor",
-            }
+    def _fallback(self, e):
+        return FallbackResult({
+            "cultural_appropriateness": "low",
+            "adaptations": [f"Cultural analysis failed: {str(e)}"],
+            "regional_notes": [],
+            "register_recommendations": "neutral",
+            "localization_suggestions": [],
+            "cultural_risks": ["Unable to assess cultural context"],
+            "target_audience_fit": "poor",
+        })
@@ -1,17 +1,14 @@
 import json
-import os
-from openai import OpenAI
+from agents.base_agent import BaseAgent, FallbackResult
 from config.agent_config import LANGUAGE_CONFIGS
 
 
-class FinalTranslatorAgent:
+class FinalTranslatorAgent(BaseAgent):
     """Final Translator Agent that creates the ultimate refined translation based on all quality analyses"""
 
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model = "gpt-5"
+    REQUIRED_KEYS = ("final_translation",)
 
-    def create_final_translation(
+    async def create_final_translation(
         self,
         source_text,
         current_translation,
@@ -21,6 +18,29 @@ class FinalTranslatorAgent:
         target_language="swedish",
     ):
         """Create the final, ultimate translation based on all quality analyses"""
+        system_prompt, user_prompt = self._build_prompts(
+            source_text,
+            current_translation,
+            quality_assessment,
+            mqm_analysis,
+            iso_compliance,
+            target_language,
+        )
+        try:
+            return await self._call_llm(system_prompt, user_prompt)
+        except Exception as e:
+            return self._fallback(e, current_translation)
+
+    def _build_prompts(
+        self,
+        source_text,
+        current_translation,
+        quality_assessment,
+        mqm_analysis,
+        iso_compliance,
+        target_language,
+    ):
+        """Build the system and user prompts for the target language"""
 
         lang_config = LANGUAGE_CONFIGS.get(target_language, LANGUAGE_CONFIGS["swedish"])
         lang_name = lang_config["name"]
@@ -153,32 +173,18 @@ class FinalTranslatorAgent:
         
         Create the ULTIMATE {lang_name} translation that represents the pinnacle of translation quality."""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                response_format={"type": "json_object"},
-            )
-
-            content = response.choices[0].message.content
-            if content is None:
-                raise ValueError("No content received from OpenAI API")
-            result = json.loads(content)
-            return result
-
-        except Exception as e:
-            return {
-                "final_translation": current_translation,
-                "quality_improvements": [f"Final translation failed: {str(e)}"],
-                "errors_fixed": [],
-                "iso_enhancements": [],
-                "confidence_level": "poor",
-                "translation_grade": "F",
-                "professional_ready": False,
-                "final_notes": [f"Final translator agent error: {str(e)}"],
-            }
+        return system_prompt, user_prompt
+
+    def _fallback(self, e, current_translation):
+        return FallbackResult({
+            "final_translation": current_translation,
+            "quality_improvements": [f"Final translation failed: {str(e)}"],
+            "errors_fixed": [],
+            "iso_enhancements": [],
+            "confidence_level": "poor",
+            "translation_grade": "F",
+            "professional_ready": False,
+            "final_notes": [f"Final translator agent error: {str(e)}"],
+        })
 
 
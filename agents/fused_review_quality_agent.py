@@ -0,0 +1,155 @@
+import json
+from agents.base_agent import BaseAgent
+from config.agent_config import LANGUAGE_CONFIGS
+
+
+class FusedReviewQualityAgent(BaseAgent):
+    """Reviewer, Quality Assessor and MQM analysis combined into a single LLM call"""
+
+    REQUIRED_KEYS = ("final_translation", "quality_assessment", "mqm_analysis")
+    # Nested sections must carry what the QualityAssessment/MQMAnalysis models require
+    QUALITY_REQUIRED_KEYS = ("overall_score", "detailed_scores")
+    MQM_REQUIRED_KEYS = ("total_score", "word_count", "error_summary", "mqm_grade", "industry_compliance")
+
+    def __init__(self, error_categories):
+        super().__init__()
+        self.error_categories = error_categories
+        # Static per language; built once instead of re-serializing the penalties per call
+        self._system_prompts = {
+            language: self._build_system_prompt(config["name"])
+            for language, config in LANGUAGE_CONFIGS.items()
+        }
+
+    async def review_and_assess(self, source_text, initial_translation, cultural_analysis, target_language="swedish"):
+        """Refine the translation and score it (quality + MQM) in one request
+
+        Returns None when the fused call fails so callers can fall back to the
+        step-by-step reviewer/assessor/MQM path.
+        """
+        system_prompt, user_prompt = self._build_prompts(source_text, initial_translation, cultural_analysis, target_language)
+        try:
+            return self._split(await self._call_llm(system_prompt, user_prompt))
+        except Exception:
+            return None
+
+    def _build_prompts(self, source_text, initial_translation, cultural_analysis, target_language):
+        """Build the combined review/assessment prompts for the target language"""
+
+        if target_language not in LANGUAGE_CONFIGS:
+            target_language = "swedish"
+        lang_name = LANGUAGE_CONFIGS[target_language]["name"]
+        system_prompt = self._system_prompts[target_language]
+
+        cultural_context = json.dumps(cultural_analysis, ensure_ascii=False, indent=2)
+
+        user_prompt = f"""Review, refine and evaluate this English to {lang_name} translation:
+
+        ORIGINAL ENGLISH:
+        "{source_text}"
+
+        INITIAL {lang_name.upper()} TRANSLATION:
+        "{initial_translation}"
+
+        CULTURAL ANALYSIS CONTEXT:
+        {cultural_context}
+
+        CRITICAL: Do NOT add any disclaimers, regulatory information, medical warnings, or contact details that are not present in the original English text.
+
+        Refine the translation first, then assess and MQM-score the refined translation (not the initial one)."""
+
+        return system_prompt, user_prompt
+
+    def _build_system_prompt(self, lang_name):
+        return f"""You are a senior {lang_name} translation reviewer, quality assessor and MQM (Multidimensional Quality Metrics) expert.
+
+        You perform three tasks in order and report all of them in one JSON response:
+
+        TASK 1 - REVIEW AND REFINE:
+        Produce a refined, error-free {lang_name} translation that meets professional standards.
+        1. Grammatical accuracy ({lang_name} morphology, syntax, agreement)
+        2. Lexical choices and terminology consistency
+        3. Stylistic appropriateness and register
+        4. Cultural adaptation and localization
+        5. Natural flow and readability
+        6. Completeness and fidelity to source meaning
+        7. NO addition of disclaimers, regulatory info, or content not in original
+        8. Preserve exact content structure and length of original text
+
+        TASK 2 - QUALITY ASSESSMENT of YOUR refined translation (each 0-100):
+        fluency, grammar, accuracy, naturalness, vocabulary, colloquial_usage.
+        Industry benchmarks: 95-100 exceptional, 85-94 professional, 70-84 acceptable, below 70 poor.
+
+        TASK 3 - MQM ANALYSIS of YOUR refined translation:
+        Categories: accuracy (mistranslation, omission, addition, untranslated),
+        fluency (grammar, spelling, punctuation, register),
+        style (awkward, unnatural, inconsistent_style),
+        terminology (inconsistent_term, wrong_term).
+        Severity levels: minor, major, critical.
+
+        Error Penalty System:
+        {json.dumps(self.error_categories, indent=2)}
+
+        Start at 100 and subtract penalties. Grade: A (90-100), B (80-89), C (70-79), D (60-69), F (<60).
+        Industry compliance when total_score >= 85.
+
+        Provide your response in JSON format:
+        {{
+            "final_translation": "refined {lang_name} translation",
+            "review_comments": ["comment1", "comment2"],
+            "changes_made": ["change1", "change2"],
+            "confidence_improvement": improvement_percentage,
+            "quality_grade": "A|B|C|D|F",
+            "quality_assessment": {{
+                "overall_score": overall_percentage,
+                "detailed_scores": {{
+                    "fluency": score,
+                    "grammar": score,
+                    "accuracy": score,
+                    "naturalness": score,
+                    "vocabulary": score,
+                    "colloquial_usage": score
+                }},
+                "assessment_notes": ["note1", "note2"],
+                "strengths": ["strength1", "strength2"],
+                "areas_for_improvement": ["area1", "area2"],
+                "industry_benchmark_met": true_or_false,
+                "error_count": number,
+                "errors_per_1000_words": number
+            }},
+            "mqm_analysis": {{
+                "total_score": calculated_score_out_of_100,
+                "word_count": number_of_words,
+                "errors": [
+                    {{
+                        "category": "accuracy|fluency|style|terminology",
+                        "subcategory": "specific_error_type",
+                        "severity": "minor|major|critical",
+                        "description": "error description",
+                        "penalty": negative_number,
+                        "location": "text segment with error"
+                    }}
+                ],
+                "error_summary": {{
+                    "total_errors": number,
+                    "accuracy_errors": number,
+                    "fluency_errors": number,
+                    "style_errors": number,
+                    "terminology_errors": number
+                }},
+                "mqm_grade": "A|B|C|D|F",
+                "industry_compliance": true_or_false
+            }}
+        }}"""
+
+    def _split(self, result):
+        """Split the fused payload into reviewer, quality and MQM results"""
+        quality_result = result.pop("quality_assessment")
+        mqm_result = result.pop("mqm_analysis")
+        self._check_keys(quality_result, self.QUALITY_REQUIRED_KEYS)
+        self._check_keys(mqm_result, self.MQM_REQUIRED_KEYS)
+        mqm_result["total_score"] = min(max(mqm_result["total_score"], 0), 100)
+        return {
+            "refined_translation": result,
+            "quality_assessment": quality_result,
+            "mqm_analysis": mqm_result,
+        }
@@ -1,15 +1,22 @@
-import json
-import os
-from openai import OpenAI
+from agents.base_agent import BaseAgent, FallbackResult
 from config.agent_config import LANGUAGE_CONFIGS
+from quality.analysis_context import AnalysisContext
 
-class QualityAssessor:
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model = "gpt-5"
-    
-    def assess(self, source_text, final_translation, target_language="swedish"):
+class QualityAssessor(BaseAgent):
+    REQUIRED_KEYS = ("overall_score", "detailed_scores")
+
+    async def assess(self, source_text, final_translation, target_language="swedish", ctx=None):
         """Comprehensive quality assessment using industry standards"""
+        if ctx is None:
+            ctx = AnalysisContext.from_texts(source_text, final_translation)
+        system_prompt, user_prompt = self._build_prompts(source_text, final_translation, target_language, ctx)
+        try:
+            return await self._call_llm(system_prompt, user_prompt)
+        except Exception as e:
+            return self._fallback(e)
+
+    def _build_prompts(self, source_text, final_translation, target_language, ctx):
+        """Build the system and user prompts for the target language"""
         
         lang_config = LANGUAGE_CONFIGS.get(target_language, LANGUAGE_CONFIGS["swedish"])
         lang_name = lang_config["name"]
@@ -71,40 +78,27 @@ class QualityAssessor:
         5. Vocabulary - appropriate word choices and terminology
         6. Colloquial usage - natural {lang_name} expressions and cultural adaptation
         
-        Calculate word count and errors per 1000 words metric.
+        Word counts (pre-computed): {ctx.prompt_summary()}
+        Calculate errors per 1000 words from the source word count above.
         Determine if translation meets professional industry standards (85%+ overall score)."""
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"}
-            )
-            
-            content = response.choices[0].message.content
-            if content is None:
-                raise ValueError("No content received from OpenAI API")
-            result = json.loads(content)
-            return result
-            
-        except Exception as e:
-            return {
-                "overall_score": 0,
-                "detailed_scores": {
-                    "fluency": 0,
-                    "grammar": 0,
-                    "accuracy": 0,
-                    "naturalness": 0,
-                    "vocabulary": 0,
-                    "colloquial_usage": 0
-                },
-                "assessment_notes": [f"Assessment failed: {str(e)}"],
-                "strengths": [],
-                "areas_for_improvement": ["Quality assessment system error"],
-                "industry_benchmark_met": False,
-                "error_count": 999,
-                "errors_per_1000_words": 999
-            }
+        return system_prompt, user_prompt
+
+    def _fallback(self, e):
+        return FallbackResult({
+            "overall_score": 0,
+            "detailed_scores": {
+                "fluency": 0,
+                "grammar": 0,
+                "accuracy": 0,
+                "naturalness": 0,
+                "vocabulary": 0,
+                "colloquial_usage": 0
+            },
+            "assessment_notes": [f"Assessment failed: {str(e)}"],
+            "strengths": [],
+            "areas_for_improvement": ["Quality assessment system error"],
+            "industry_benchmark_met": False,
+            "error_count": 999,
+            "errors_per_1000_words": 999
+        })
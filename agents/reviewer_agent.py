@@ -1,15 +1,20 @@
 import json
-import os
-from openai import OpenAI
+from agents.base_agent import BaseAgent, FallbackResult
 from config.agent_config import LANGUAGE_CONFIGS
 
-class ReviewerAgent:
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model = "gpt-5"
-    
-    def review(self, source_text, initial_translation, cultural_analysis, target_language="swedish"):
+class ReviewerAgent(BaseAgent):
+    REQUIRED_KEYS = ("final_translation",)
+
+    async def review(self, source_text, initial_translation, cultural_analysis, target_language="swedish"):
         """Review and refine the initial translation based on linguistic and cultural analysis"""
+        system_prompt, user_prompt = self._build_prompts(source_text, initial_translation, cultural_analysis, target_language)
+        try:
+            return await self._call_llm(system_prompt, user_prompt)
+        except Exception as e:
+            return self._fallback(e, initial_translation)
+
+    def _build_prompts(self, source_text, initial_translation, cultural_analysis, target_language):
+        """Build the system and user prompts for the target language"""
         
         lang_config = LANGUAGE_CONFIGS.get(target_language, LANGUAGE_CONFIGS["swedish"])
         lang_name = lang_config["name"]
@@ -90,27 +95,13 @@ class ReviewerAgent:
         
         Provide an improved, refined {lang_name} translation that matches the original text's structure and content exactly."""
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"}
-            )
-            
-            content = response.choices[0].message.content
-            if content is None:
-                raise ValueError("No content received from OpenAI API")
-            result = json.loads(content)
-            return result
-            
-        except Exception as e:
-            return {
-                "final_translation": initial_translation,
-                "review_comments": [f"Review failed: {str(e)}"],
-                "changes_made": [],
-                "confidence_improvement": 0,
-                "quality_grade": "F"
-            }
+        return system_prompt, user_prompt
+
+    def _fallback(self, e, initial_translation):
+        return FallbackResult({
+            "final_translation": initial_translation,
+            "review_comments": [f"Review failed: {str(e)}"],
+            "changes_made": [],
+            "confidence_improvement": 0,
+            "quality_grade": "F"
+        })
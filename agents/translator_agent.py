@@ -1,18 +1,73 @@
-import json
-import os
-from openai import OpenAI
+import functools
+
+from agents.base_agent import BaseAgent, FallbackResult
 from config.agent_config import LANGUAGE_CONFIGS
 from utils.GLOSSARY.dutch import dutch
 
 
-class TranslatorAgent:
+class TranslatorAgent(BaseAgent):
+    # Separates segments of a merged batch prompt
+    BATCH_DELIMITER = "%%"
+    REQUIRED_KEYS = ("translation", "confidence")
+
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model = "gpt-5"
+        super().__init__()
         self.glossary = dutch
 
-    def translate(self, source_text, target_language="swedish"):
+    async def translate(self, source_text, target_language="swedish"):
         """Perform high-quality English to target language translation"""
+        system_prompt, user_prompt = self._build_prompts(source_text, target_language)
+        try:
+            result = await self._call_llm(system_prompt, user_prompt)
+            return self._postprocess(result, target_language)
+        except Exception as e:
+            return self._fallback(e)
+
+    async def translate_batch(self, source_texts, target_language="swedish"):
+        """Translate several texts in one LLM call
+
+        Returns one result per text, each with its own confidence and notes, or
+        None when the call fails or the reply doesn't hold a complete result
+        for every text.
+        """
+        system_prompt, user_prompt = self._build_batch_prompts(source_texts, target_language)
+        try:
+            result = await self._call_llm(system_prompt, user_prompt, required_keys=("translations",))
+        except Exception:
+            return None
+
+        entries = result["translations"]
+        if not isinstance(entries, list) or len(entries) != len(source_texts):
+            return None
+        try:
+            for entry in entries:
+                self._check_keys(entry, self.REQUIRED_KEYS)
+        except ValueError:
+            return None
+
+        return [self._postprocess(entry, target_language) for entry in entries]
+
+    def _build_batch_prompts(self, source_texts, target_language):
+        """Build prompts translating source_texts as delimiter-separated segments"""
+        separator = f"\n{self.BATCH_DELIMITER}\n"
+        system_prompt, user_prompt = self._build_prompts(separator.join(source_texts), target_language)
+        user_prompt += f"""
+
+        BATCH FORMAT: The text above contains {len(source_texts)} independent segments separated by lines containing only "{self.BATCH_DELIMITER}".
+        Translate each segment on its own. Return {{"translations": [...]}} with exactly {len(source_texts)} objects in segment order,
+        each in the JSON structure above, with confidence, notes and decisions that describe that segment only.
+        Do NOT merge, split or drop segments, and do NOT include the separators."""
+        return system_prompt, user_prompt
+
+    def _build_prompts(self, source_text, target_language):
+        """Build the system and user prompts for the target language"""
+        system_prompt, user_prefix, user_suffix = self._prompt_parts(target_language)
+        return system_prompt, f'{user_prefix}"{source_text}"{user_suffix}'
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _prompt_parts(target_language):
+        """System prompt and the user prompt before/after the quoted source text, built once per language"""
 
         lang_config = LANGUAGE_CONFIGS.get(target_language, LANGUAGE_CONFIGS["swedish"])
         lang_name = lang_config["name"]
@@ -82,9 +137,10 @@ class TranslatorAgent:
                 "key_decisions": ["decision1", "decision2"]
             }"""
 
-        user_prompt = f"""Translate this English text to {lang_name} with professional quality:
+        user_prefix = f"""Translate this English text to {lang_name} with professional quality:
 
-        "{source_text}"
+        """
+        user_suffix = f"""
         
         IMPORTANT: Translate ONLY the content provided above. Do NOT add any disclaimers, regulatory information, medical warnings, or contact details that are not present in the original text.
         
@@ -96,38 +152,27 @@ class TranslatorAgent:
         5. {lang_name} linguistic conventions
         6. Faithful reproduction of the original content structure"""
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                response_format={"type": "json_object"},
-            )
-
-            content = response.choices[0].message.content
-            if content is None:
-                raise ValueError("No content received from OpenAI API")
-            result = json.loads(content)
-            if target_language == "dutch":
-                original_translation = result["translation"]
-                result["translation"] = self._apply_glossary(original_translation)
-            
-                # TODO: uncomment it Track if glossary was applied 
-                # if original_translation != result["translation"]:
-                #     result["translation_notes"].append("Glossary terms applied")
-                    
-            return result
+        return system_prompt, user_prefix, user_suffix
 
-        except Exception as e:
-            return {
-                "translation": f"Translation failed: {str(e)}",
-                "confidence": 0,
-                "translation_notes": ["Error in translation process"],
-                "difficulty_level": "error",
-                "key_decisions": [],
-            }
+    def _postprocess(self, result, target_language):
+        if target_language == "dutch":
+            original_translation = result["translation"]
+            result["translation"] = self._apply_glossary(original_translation)
+
+            # TODO: uncomment it Track if glossary was applied 
+            # if original_translation != result["translation"]:
+            #     result["translation_notes"].append("Glossary terms applied")
+
+        return result
+
+    def _fallback(self, e):
+        return FallbackResult({
+            "translation": f"Translation failed: {str(e)}",
+            "confidence": 0,
+            "translation_notes": ["Error in translation process"],
+            "difficulty_level": "error",
+            "key_decisions": [],
+        })
 
     def _apply_glossary(self, text):
         # Same logic as DeepL system
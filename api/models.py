@@ -1,5 +1,6 @@
+from datetime import datetime
 from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from enum import Enum
 
 
@@ -98,7 +99,13 @@ class BatchTranslationRequest(BaseModel):
 
 
 # Response Models
-class TranslationResult(BaseModel):
+class ResponseModel(BaseModel):
+    """Base for pipeline response models, validated once from raw agent dicts"""
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+
+class TranslationResult(ResponseModel):
     """Individual translation result"""
 
     translation: str = Field(..., description="Translated text")
@@ -109,14 +116,14 @@ class TranslationResult(BaseModel):
         default_factory=list, description="Translation notes"
     )
     difficulty_level: Literal["easy", "medium", "hard", "error"] = Field(
-        ..., description="Translation difficulty"
+        default="medium", description="Translation difficulty"
     )
     key_decisions: List[str] = Field(
         default_factory=list, description="Key translation decisions"
     )
 
 
-class CulturalAnalysis(BaseModel):
+class CulturalAnalysis(ResponseModel):
     """Cultural analysis result"""
 
     cultural_appropriateness: CulturalAppropriateness = Field(
@@ -129,7 +136,7 @@ class CulturalAnalysis(BaseModel):
         default_factory=list, description="Regional considerations"
     )
     register_recommendations: Literal["formal", "informal", "neutral"] = Field(
-        ..., description="Register recommendations"
+        default="neutral", description="Register recommendations"
     )
     localization_suggestions: List[str] = Field(
         default_factory=list, description="Localization suggestions"
@@ -138,11 +145,11 @@ class CulturalAnalysis(BaseModel):
         default_factory=list, description="Potential cultural risks"
     )
     target_audience_fit: TargetAudienceFit = Field(
-        ..., description="Target audience fit"
+        default=TargetAudienceFit.FAIR, description="Target audience fit"
     )
 
 
-class ReviewResult(BaseModel):
+class ReviewResult(ResponseModel):
     """Review and refinement result"""
 
     final_translation: str = Field(..., description="Final refined translation")
@@ -153,12 +160,12 @@ class ReviewResult(BaseModel):
         default_factory=list, description="Changes made during review"
     )
     confidence_improvement: float = Field(
-        ..., ge=0, le=100, description="Confidence improvement percentage"
+        default=0, ge=0, le=100, description="Confidence improvement percentage"
     )
-    quality_grade: QualityGrade = Field(..., description="Quality grade")
+    quality_grade: QualityGrade = Field(default=QualityGrade.C, description="Quality grade")
 
 
-class QualityScores(BaseModel):
+class QualityScores(ResponseModel):
     """Detailed quality scores"""
 
     fluency: float = Field(..., ge=0, le=100, description="Fluency score")
@@ -171,7 +178,7 @@ class QualityScores(BaseModel):
     )
 
 
-class QualityAssessment(BaseModel):
+class QualityAssessment(ResponseModel):
     """Quality assessment result"""
 
     overall_score: float = Field(..., ge=0, le=100, description="Overall quality score")
@@ -186,13 +193,13 @@ class QualityAssessment(BaseModel):
         default_factory=list, description="Areas for improvement"
     )
     industry_benchmark_met: bool = Field(
-        ..., description="Whether industry benchmark is met"
+        default=False, description="Whether industry benchmark is met"
     )
-    error_count: int = Field(..., ge=0, description="Total error count")
-    errors_per_1000_words: float = Field(..., ge=0, description="Errors per 1000 words")
+    error_count: int = Field(default=0, ge=0, description="Total error count")
+    errors_per_1000_words: float = Field(default=0, ge=0, description="Errors per 1000 words")
 
 
-class MQMError(BaseModel):
+class MQMError(ResponseModel):
     """MQM error details"""
 
     category: Literal["accuracy", "fluency", "style", "terminology"] = Field(
@@ -205,7 +212,7 @@ class MQMError(BaseModel):
     location: str = Field(..., description="Error location in text")
 
 
-class ErrorSummary(BaseModel):
+class ErrorSummary(ResponseModel):
     """Error summary statistics"""
 
     total_errors: int = Field(..., ge=0, description="Total error count")
@@ -215,7 +222,7 @@ class ErrorSummary(BaseModel):
     terminology_errors: int = Field(..., ge=0, description="Terminology error count")
 
 
-class MQMAnalysis(BaseModel):
+class MQMAnalysis(ResponseModel):
     """MQM framework analysis result"""
 
     total_score: float = Field(..., ge=0, le=100, description="Total MQM score")
@@ -226,7 +233,7 @@ class MQMAnalysis(BaseModel):
     industry_compliance: bool = Field(..., description="Industry compliance status")
 
 
-class ISOCompliance(BaseModel):
+class ISOCompliance(ResponseModel):
     """ISO 17100:2015 compliance result"""
 
     compliant: bool = Field(..., description="Overall compliance status")
@@ -241,7 +248,9 @@ class ISOCompliance(BaseModel):
     iso_standard: str = Field(
         default="ISO 17100:2015", description="ISO standard version"
     )
-    assessment_date: str = Field(..., description="Assessment date")
+    assessment_date: str = Field(
+        default_factory=lambda: datetime.now().isoformat(), description="Assessment date"
+    )
 
 
 class FinalTranslationResult(BaseModel):
@@ -271,7 +280,7 @@ class FinalTranslationResult(BaseModel):
     )
 
 
-class TranslationResponse(BaseModel):
+class TranslationResponse(ResponseModel):
     """Complete translation response"""
 
     request_id: str = Field(..., description="Unique request identifier")
@@ -369,6 +378,14 @@ class MQMAnalysisRequest(BaseModel):
     )
 
 
+class BatchMQMAnalysisRequest(BaseModel):
+    """Request for MQM analysis of several translations in one LLM call"""
+
+    items: List[MQMAnalysisRequest] = Field(
+        ..., min_length=1, max_length=10, description="Translations to analyze"
+    )
+
+
 class ISOComplianceRequest(BaseModel):
     """Request for ISO compliance check only"""
 
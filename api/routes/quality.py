@@ -2,9 +2,10 @@
 Quality assessment endpoints
 """
 
+import secrets
 import time
-import uuid
 from datetime import datetime
+from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from api.models import (
     QualityAssessment,
@@ -12,11 +13,13 @@ from api.models import (
     ISOCompliance,
     QualityAssessmentRequest,
     MQMAnalysisRequest,
+    BatchMQMAnalysisRequest,
     ISOComplianceRequest,
     CombinedAnalysisRequest,
     CombinedAnalysisResponse,
 )
 from core.translation_service import TranslationService
+from quality.analysis_context import AnalysisContext
 from core.config import settings
 
 router = APIRouter()
@@ -201,8 +204,7 @@ async def assess_quality(
 
         # Run quality assessment
         start_time = time.time()
-        quality_result = await service._run_agent_async(
-            service.quality_assessor.assess,
+        quality_result = await service.quality_assessor.assess(
             request.source_text,
             request.final_translation,
             request.target_language.value,
@@ -257,11 +259,18 @@ async def analyze_mqm(
 
         # Run MQM analysis
         start_time = time.time()
-        mqm_result = await service._run_agent_async(
+        quality_assessment = request.quality_assessment.dict() if request.quality_assessment else {}
+        mqm_result = await service._run_cached_step(
+            "mqm_framework",
+            {
+                "source_text": request.source_text,
+                "final_text": request.final_translation,
+                "quality_assessment": quality_assessment,
+            },
             service.mqm_framework.analyze,
             request.source_text,
             request.final_translation,
-            request.quality_assessment.dict() if request.quality_assessment else {},
+            quality_assessment,
         )
 
         processing_time = time.time() - start_time
@@ -281,6 +290,46 @@ async def analyze_mqm(
         raise HTTPException(status_code=500, detail=f"MQM analysis failed: {str(e)}")
 
 
+@router.post("/quality/mqm/batch", response_model=List[MQMAnalysis])
+async def analyze_mqm_batch(
+    request: BatchMQMAnalysisRequest,
+    service: TranslationService = Depends(get_translation_service),
+):
+    """
+    Analyze several translations with the MQM framework in a single LLM call
+
+    Results are returned in request order. Items the merged analysis can't
+    cover are analyzed individually, so every item gets a result.
+    """
+    try:
+        for item in request.items:
+            if (
+                len(item.source_text) > settings.MAX_TEXT_LENGTH
+                or len(item.final_translation) > settings.MAX_TEXT_LENGTH
+            ):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Text too long. Maximum length is {settings.MAX_TEXT_LENGTH} characters",
+                )
+
+        mqm_results = await service.mqm_framework.analyze_batch(
+            [
+                (
+                    item.source_text,
+                    item.final_translation,
+                    item.quality_assessment.dict() if item.quality_assessment else {},
+                )
+                for item in request.items
+            ]
+        )
+        return [MQMAnalysis.model_validate(mqm_result) for mqm_result in mqm_results]
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"MQM analysis failed: {str(e)}")
+
+
 @router.post("/quality/iso", response_model=ISOCompliance)
 async def check_iso_compliance(
     request: ISOComplianceRequest,
@@ -330,9 +379,7 @@ async def check_iso_compliance(
 
         # Run ISO compliance check
         start_time = time.time()
-        iso_result = await service._run_agent_async(
-            service.iso_standards.validate, results
-        )
+        iso_result = service.iso_standards.validate(results)
 
         processing_time = time.time() - start_time
 
@@ -390,26 +437,38 @@ async def combined_quality_analysis(
             )
 
         start_time = time.time()
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
 
         # Run all three analyses in parallel
         import asyncio
 
+        # Text statistics shared by the quality assessment and MQM analysis
+        analysis_context = AnalysisContext.from_texts(
+            request.source_text, request.final_translation
+        )
+
         # Quality Assessment
-        quality_task = service._run_agent_async(
-            service.quality_assessor.assess,
+        quality_task = service.quality_assessor.assess(
             request.source_text,
             request.final_translation,
             request.target_language.value,
+            analysis_context,
         )
 
         # MQM Analysis (needs quality assessment result)
         quality_result = await quality_task
-        mqm_task = service._run_agent_async(
+        mqm_task = service._run_cached_step(
+            "mqm_framework",
+            {
+                "source_text": request.source_text,
+                "final_text": request.final_translation,
+                "quality_assessment": quality_result,
+            },
             service.mqm_framework.analyze,
             request.source_text,
             request.final_translation,
             quality_result,
+            analysis_context,
         )
 
         # ISO Compliance (needs all results)
@@ -422,10 +481,9 @@ async def combined_quality_analysis(
             "mqm_analysis": mqm_result,
         }
 
-        iso_task = service._run_agent_async(service.iso_standards.validate, results)
-
-        iso_result = await iso_task
+        iso_result = service.iso_standards.validate(results)
         processing_time = time.time() - start_time
+        timestamp = datetime.now().isoformat()
 
         return CombinedAnalysisResponse(
             request_id=request_id,
@@ -459,12 +517,10 @@ async def combined_quality_analysis(
                 detailed_scores=iso_result["detailed_scores"],
                 recommendations=iso_result.get("recommendations", []),
                 iso_standard=iso_result.get("iso_standard", "ISO 17100:2015"),
-                assessment_date=iso_result.get(
-                    "assessment_date", datetime.now().isoformat()
-                ),
+                assessment_date=iso_result.get("assessment_date", timestamp),
             ),
             processing_time=processing_time,
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
         )
 
     except HTTPException:
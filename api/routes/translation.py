@@ -3,7 +3,9 @@ Translation endpoints
 """
 
 import asyncio
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from typing import List
 from api.models import (
     TranslationRequest,
@@ -16,9 +18,11 @@ from api.models import (
     EmailTranslationResponse,
     Api1TranslationRequest,
     Api1TranslationResponse,
+    QualityMode,
 )
 from core.translation_service import TranslationService
 from core.config import settings
+from core.rate_limiter import enforce_rate_limit
 
 router = APIRouter()
 
@@ -32,7 +36,12 @@ def get_translation_service() -> TranslationService:
     return translation_service
 
 
-@router.post("/translate", response_model=TranslationResponse)
+@router.post(
+    "/translate",
+    response_model=TranslationResponse,
+    response_model_exclude_none=True,
+    dependencies=[Depends(enforce_rate_limit)],
+)
 async def translate_text(
     request: TranslationRequest,
     service: TranslationService = Depends(get_translation_service),
@@ -74,7 +83,11 @@ async def translate_text(
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
 
-@router.post("/translate/api2", response_model=EmailTranslationResponse)
+@router.post(
+    "/translate/api2",
+    response_model=EmailTranslationResponse,
+    dependencies=[Depends(enforce_rate_limit)],
+)
 async def translate_email(
     request: EmailTranslationRequest,
     service: TranslationService = Depends(get_translation_service),
@@ -94,7 +107,6 @@ async def translate_email(
             raise HTTPException(status_code=400, detail="Invalid language code")
 
         async def translate_full(text: str) -> str:
-            from api.models import QualityMode
             result = await service.translate(
                 TranslationRequest(
                     source_text=text,
@@ -146,7 +158,38 @@ async def translate_email(
         )
 
 
-@router.post("/translate/batch", response_model=BatchTranslationResponse)
+def validate_batch_request(request: BatchTranslationRequest):
+    """Reject oversized batches, texts and unsupported languages with a 400"""
+    # Validate batch size
+    if len(request.translations) > 10:
+        raise HTTPException(
+            status_code=400,
+            detail="Batch size too large. Maximum 10 translations per batch",
+        )
+
+    # Validate each request
+    for i, translation_request in enumerate(request.translations):
+        if len(translation_request.source_text) > settings.MAX_TEXT_LENGTH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Text too long in request {i+1}. Maximum length is {settings.MAX_TEXT_LENGTH} characters",
+            )
+
+        if (
+            translation_request.target_language.value
+            not in settings.SUPPORTED_LANGUAGES
+        ):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported target language in request {i+1}. Supported languages: {settings.SUPPORTED_LANGUAGES}",
+            )
+
+
+@router.post(
+    "/translate/batch",
+    response_model=BatchTranslationResponse,
+    dependencies=[Depends(enforce_rate_limit)],
+)
 async def translate_batch(
     request: BatchTranslationRequest,
     service: TranslationService = Depends(get_translation_service),
@@ -157,29 +200,7 @@ async def translate_batch(
     Process multiple translation requests efficiently with optional parallel processing.
     """
     try:
-        # Validate batch size
-        if len(request.translations) > 10:
-            raise HTTPException(
-                status_code=400,
-                detail="Batch size too large. Maximum 10 translations per batch",
-            )
-
-        # Validate each request
-        for i, translation_request in enumerate(request.translations):
-            if len(translation_request.source_text) > settings.MAX_TEXT_LENGTH:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Text too long in request {i+1}. Maximum length is {settings.MAX_TEXT_LENGTH} characters",
-                )
-
-            if (
-                translation_request.target_language.value
-                not in settings.SUPPORTED_LANGUAGES
-            ):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unsupported target language in request {i+1}. Supported languages: {settings.SUPPORTED_LANGUAGES}",
-                )
+        validate_batch_request(request)
 
         # Process batch translation
         result = await service.translate_batch(request.translations)
@@ -193,6 +214,30 @@ async def translate_batch(
         )
 
 
+@router.post(
+    "/translate/batch/stream",
+    dependencies=[Depends(enforce_rate_limit)],
+)
+async def translate_batch_stream(
+    request: BatchTranslationRequest,
+    service: TranslationService = Depends(get_translation_service),
+):
+    """
+    Translate multiple texts, streaming each result as soon as it is ready
+
+    Responds with NDJSON: one {"index": ..., "result": TranslationResponse}
+    line per translation, in completion order. index refers to the position
+    in the request's translations list.
+    """
+    validate_batch_request(request)
+
+    async def ndjson_lines():
+        async for index, result in service.translate_batch_stream(request.translations):
+            yield orjson.dumps({"index": index, "result": result.model_dump(mode="json", exclude_none=True)}) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/languages")
 async def get_supported_languages(
     service: TranslationService = Depends(get_translation_service),
@@ -227,7 +272,11 @@ async def get_translation_status(request_id: str):
     }
 
 
-@router.post("/translate/api1", response_model=Api1TranslationResponse)
+@router.post(
+    "/translate/api1",
+    response_model=Api1TranslationResponse,
+    dependencies=[Depends(enforce_rate_limit)],
+)
 async def api1(
     request: Api1TranslationRequest,
     service: TranslationService = Depends(get_translation_service),
@@ -249,7 +298,6 @@ async def api1(
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid language code")
 
-        from api.models import QualityMode
         result = await service.translate(
             TranslationRequest(
                 source_text=request.text,
@@ -74,7 +74,39 @@ PROCESS_CONFIG = {
     "enable_parallel_processing": True,
     "max_retry_attempts": 3,
     "timeout_seconds": 120,
-    "enable_caching": True
+    "enable_caching": True,
+    "step_cache_size": 1024,
+    # translate_batch merges same-language items into one translator call,
+    # up to this many items / source characters per call
+    "batch_max_items": 10,
+    "batch_max_chars": 5000,
+    # MQM replies list at most this many errors (most severe first); the
+    # score and error summary still count all of them
+    "mqm_max_listed_errors": 20,
+    # Pipeline inputs that invalidate each step's cached output. A step that is
+    # not listed here is never cached. Only list quality_mode for steps whose
+    # output differs by mode, so e.g. re-running a balanced request in quality
+    # mode reuses the translator and cultural advisor results.
+    "step_cache_keys": {
+        "translator": ("source_text", "target_language"),
+        "cultural_advisor": ("source_text", "target_language", "initial_translation"),
+        "reviewer": ("source_text", "target_language", "initial_translation", "cultural_analysis", "quality_mode"),
+        "fused_review_quality": ("source_text", "target_language", "initial_translation", "cultural_analysis"),
+        # Quality estimation is keyed on the text actually being evaluated
+        "quality_assessor": ("source_text", "target_language", "final_text"),
+        "mqm_framework": ("source_text", "final_text", "quality_assessment"),
+        # iso_standards is a cheap local computation and is not cached.
+    },
+    # Keys a step's result must carry before it is cached; anything less is
+    # served once and then recomputed
+    "step_required_keys": {
+        "translator": ("translation", "confidence"),
+        "cultural_advisor": ("cultural_appropriateness",),
+        "reviewer": ("final_translation",),
+        "fused_review_quality": ("refined_translation", "quality_assessment", "mqm_analysis"),
+        "quality_assessor": ("overall_score", "detailed_scores"),
+        "mqm_framework": ("total_score", "error_summary", "mqm_grade", "industry_compliance"),
+    },
 }
 
 # Quality Assessment Weights
@@ -0,0 +1,158 @@
+"""
+Asynchronous batching of translator calls across concurrent requests
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from config.agent_config import PROCESS_CONFIG
+from core.config import settings
+
+
+def group_for_batching(
+    items: Sequence[Tuple[str, str]],
+    delimiter: str,
+    max_items: int = PROCESS_CONFIG["batch_max_items"],
+    max_chars: int = PROCESS_CONFIG["batch_max_chars"],
+) -> List[Tuple[str, List[int]]]:
+    """Split (source_text, target_language) items into per-language chunks
+
+    Returns (target_language, item indices) pairs holding at most max_items
+    items and max_chars source characters each, grouped by text length (a single oversized item still
+    gets its own chunk). Texts containing the batch delimiter can't be merged
+    and always end up alone.
+    """
+    groups: Dict[str, List[int]] = {}
+    chunks = []
+    for i, (source_text, target_language) in enumerate(items):
+        if delimiter in source_text:
+            chunks.append((target_language, [i]))
+        else:
+            groups.setdefault(target_language, []).append(i)
+
+    for target_language, indices in groups.items():
+        chunk, chars = [], 0
+        # Length-sorted so each chunk holds similarly sized texts and packs
+        # tightly against max_chars
+        for i in sorted(indices, key=lambda i: len(items[i][0])):
+            size = len(items[i][0])
+            if chunk and (len(chunk) >= max_items or chars + size > max_chars):
+                chunks.append((target_language, chunk))
+                chunk, chars = [], 0
+            chunk.append(i)
+            chars += size
+        if chunk:
+            chunks.append((target_language, chunk))
+    return chunks
+
+
+class BatchQueue:
+    """Collect translator calls from concurrent requests into merged batches
+
+    A background worker dispatches queued calls once batch_size of them are
+    waiting or flush_interval_ms has passed since the first one arrived.
+    Each batch is sent without waiting for the previous one, so results are
+    released as soon as their own batch returns.
+
+    Texts from different clients share a prompt, so this only runs when
+    TRANSLATOR_BATCHING_ENABLED opts in.
+    """
+
+    def __init__(
+        self,
+        translator,
+        batch_size: int = settings.TRANSLATOR_BATCH_SIZE,
+        flush_interval_ms: int = settings.TRANSLATOR_FLUSH_INTERVAL_MS,
+    ):
+        self.translator = translator
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self):
+        """Start the flush worker on the running event loop"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the worker and cancel calls that have not been dispatched yet"""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            future.cancel()
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def submit(self, source_text: str, target_language: str) -> asyncio.Future:
+        """Queue one translator call; the future resolves to its result dict"""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((source_text, target_language, future))
+        return future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch):
+        chunks = group_for_batching(
+            [(source_text, target_language) for source_text, target_language, _ in batch],
+            self.translator.BATCH_DELIMITER,
+        )
+        await asyncio.gather(
+            *[self._dispatch_chunk([batch[i] for i in chunk]) for _, chunk in chunks]
+        )
+
+    async def _dispatch_chunk(self, entries):
+        try:
+            target_language = entries[0][1]
+            results = None
+            if len(entries) > 1:
+                results = await self.translator.translate_batch(
+                    [source_text for source_text, _, _ in entries], target_language
+                )
+            if results is None:
+                # Single call, or a merged reply that couldn't be split back
+                results = await asyncio.gather(
+                    *[
+                        self.translator.translate(source_text, target_language)
+                        for source_text, target_language, _ in entries
+                    ]
+                )
+        except Exception as e:
+            for _, _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, future), result in zip(entries, results):
+            if not future.done():
+                future.set_result(result)
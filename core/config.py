@@ -30,6 +30,30 @@ class Settings(BaseSettings):
 
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_BURST: int = 10
+    # SQLite file holding the rate limit buckets, shared by every worker on
+    # the host. Empty keeps them in process memory, where each uvicorn worker
+    # applies the limit separately.
+    RATE_LIMIT_DATABASE_PATH: str = ""
+
+    # Upper bounds on in-flight OpenAI calls (across all agents) and on
+    # concurrently processed requests within a batch
+    MAX_CONCURRENT_LLM_CALLS: int = 8
+    MAX_CONCURRENT_BATCH_REQUESTS: int = 4
+
+    # Opt-in: merge translator calls from concurrent, unrelated requests into
+    # one LLM call once this many are queued or the flush interval has passed.
+    # Off by default: it puts different clients' texts in the same prompt (one
+    # can steer or leak into another's translation) and delays every single
+    # /translate by up to the flush interval. Batch requests always merge
+    # their own items regardless.
+    TRANSLATOR_BATCHING_ENABLED: bool = False
+    TRANSLATOR_BATCH_SIZE: int = 10
+    TRANSLATOR_FLUSH_INTERVAL_MS: int = 50
+
+    # Connect to the LLM provider at startup and keep the connection alive
+    # with a lightweight request every LLM_KEEPALIVE_SECONDS (0 disables)
+    LLM_WARMUP_ENABLED: bool = True
+    LLM_KEEPALIVE_SECONDS: int = 60
 
     DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite:///./langTranslator.db")
 
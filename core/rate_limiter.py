@@ -0,0 +1,136 @@
+"""
+Per-client rate limiting for the translation endpoints
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException, Request
+
+from core.config import settings
+
+
+class RateLimiter:
+    """Token bucket per client: refills at rate_per_minute, holds at most burst tokens
+
+    Without a database_path the buckets live in this process, so every
+    uvicorn worker enforces the limit on its own (N workers allow N times the
+    rate). With one, all workers on the host share the buckets in that SQLite
+    file.
+    """
+
+    # Forget idle clients once this many buckets are tracked
+    MAX_TRACKED_CLIENTS = 10000
+    # Shared store: drop fully refilled buckets every this many calls
+    PRUNE_EVERY = 1000
+
+    def __init__(self, rate_per_minute: int, burst: int, database_path: Optional[str] = None):
+        self.refill_per_second = rate_per_minute / 60.0
+        self.capacity = float(burst)
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._conn = None
+        if database_path:
+            self._lock = threading.Lock()
+            self._calls = 0
+            # Autocommit: every upsert is its own atomic transaction
+            self._conn = sqlite3.connect(database_path, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "client_id TEXT PRIMARY KEY, tokens REAL NOT NULL, "
+                "updated_at REAL NOT NULL, allowed INTEGER NOT NULL)"
+            )
+
+    @property
+    def shared(self) -> bool:
+        return self._conn is not None
+
+    def allow(self, client_id: str) -> bool:
+        """Consume one token for client_id, returning False when the bucket is empty"""
+        if self.shared:
+            return self._allow_shared(client_id)
+
+        now = time.monotonic()
+        tokens, last_seen = self._buckets.get(client_id, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - last_seen) * self.refill_per_second)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+
+        if client_id not in self._buckets and len(self._buckets) >= self.MAX_TRACKED_CLIENTS:
+            self._prune(now)
+        self._buckets[client_id] = (tokens, now)
+        return allowed
+
+    def _allow_shared(self, client_id: str) -> bool:
+        # Wall-clock time, since the timestamps are compared across processes.
+        # The refill is computed in SQL so read-modify-write is one statement.
+        refilled = "MIN(:capacity, tokens + (:now - updated_at) * :rate)"
+        now = time.time()
+        params = {"client_id": client_id, "capacity": self.capacity, "now": now, "rate": self.refill_per_second}
+        with self._lock:
+            allowed = self._conn.execute(
+                "INSERT INTO rate_limit_buckets (client_id, tokens, updated_at, allowed) "
+                "VALUES (:client_id, :capacity - 1, :now, :capacity >= 1) "
+                "ON CONFLICT (client_id) DO UPDATE SET "
+                f"tokens = CASE WHEN {refilled} >= 1 THEN {refilled} - 1 ELSE {refilled} END, "
+                f"allowed = {refilled} >= 1, "
+                "updated_at = :now "
+                "RETURNING allowed",
+                params,
+            ).fetchone()[0]
+            self._calls += 1
+            if self._calls % self.PRUNE_EVERY == 0:
+                self._conn.execute(
+                    "DELETE FROM rate_limit_buckets WHERE updated_at < ?", (now - self._full_after(),)
+                )
+        return bool(allowed)
+
+    def _full_after(self) -> float:
+        """Seconds after which an idle bucket has refilled completely"""
+        return self.capacity / self.refill_per_second if self.refill_per_second else 0
+
+    def _prune(self, now: float):
+        """Drop buckets that have refilled completely (i.e. idle clients)"""
+        full_after = self._full_after()
+        self._buckets = {
+            client_id: bucket
+            for client_id, bucket in self._buckets.items()
+            if now - bucket[1] < full_after
+        }
+
+    def close(self):
+        if self._conn is not None:
+            with self._lock:
+                self._conn.close()
+            self._conn = None
+
+
+rate_limiter = RateLimiter(
+    settings.RATE_LIMIT_PER_MINUTE,
+    settings.RATE_LIMIT_BURST,
+    settings.RATE_LIMIT_DATABASE_PATH or None,
+)
+
+
+async def enforce_rate_limit(request: Request):
+    """Dependency that rejects requests above RATE_LIMIT_PER_MINUTE per client
+
+    Clients are told apart by address. Behind a reverse proxy this is only the
+    caller's address if uvicorn trusts the proxy's X-Forwarded-For header
+    (--proxy-headers with --forwarded-allow-ips covering the proxy).
+    """
+    client_id = request.client.host if request.client else "anonymous"
+    if rate_limiter.shared:
+        allowed = await asyncio.to_thread(rate_limiter.allow, client_id)
+    else:
+        allowed = rate_limiter.allow(client_id)
+    if not allowed:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Rate limit exceeded. Maximum {settings.RATE_LIMIT_PER_MINUTE} requests per minute",
+        )
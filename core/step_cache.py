@@ -0,0 +1,61 @@
+"""
+In-memory cache of agent step outputs for the translation pipeline
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from config.agent_config import PROCESS_CONFIG
+
+
+class StepCache:
+    """LRU cache of agent step results keyed by the inputs each step depends on
+
+    Which pipeline inputs make up a step's key is declared in
+    PROCESS_CONFIG["step_cache_keys"]; steps missing from that table are never
+    cached. Results lacking the keys listed for their step in
+    PROCESS_CONFIG["step_required_keys"] are not stored. Cached results are shared between requests and must be treated as
+    read-only.
+    """
+
+    def __init__(self, maxsize: int = PROCESS_CONFIG["step_cache_size"]):
+        self.maxsize = maxsize
+        self.key_fields = PROCESS_CONFIG["step_cache_keys"]
+        self.required_keys = PROCESS_CONFIG["step_required_keys"]
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def make_key(self, step: str, inputs: Dict[str, Any]) -> Optional[str]:
+        """Build the cache key for step from the pipeline inputs it depends on"""
+        fields = self.key_fields.get(step)
+        if fields is None:
+            return None
+        payload = json.dumps(
+            [step, [inputs.get(field) for field in fields]],
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def is_complete(self, step: str, result: Any) -> bool:
+        """Whether result carries every key its step must have to be cached"""
+        return isinstance(result, dict) and all(
+            field in result for field in self.required_keys.get(step, ())
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def set(self, key: str, result: Dict[str, Any]):
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -3,15 +3,23 @@ Core translation service with multi-agent architecture
 """
 
 import asyncio
+import secrets
 import time
-import uuid
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Dict, Mapping, Optional, Tuple
 from datetime import datetime
 
 from agents.translator_agent import TranslatorAgent
 from agents.reviewer_agent import ReviewerAgent
 from agents.quality_assessor import QualityAssessor
 from agents.cultural_advisor import CulturalAdvisor
+from agents.fused_review_quality_agent import FusedReviewQualityAgent
+from agents.base_agent import FallbackResult, close_openai_client
+from config.agent_config import LANGUAGE_CONFIGS, PROCESS_CONFIG
+from core.batch_queue import BatchQueue, group_for_batching
+from core.config import settings
+from core.step_cache import StepCache
+from quality.analysis_context import AnalysisContext
 from quality.mqm_framework import MQMFramework
 from quality.iso_standards import ISOStandards
 from api.models import (
@@ -19,14 +27,27 @@ from api.models import (
     TranslationResponse,
     BatchTranslationResponse,
     TranslationResult,
-    CulturalAnalysis,
-    ReviewResult,
-    QualityAssessment,
-    MQMAnalysis,
-    ISOCompliance,
     ErrorResponse,
+    QualityMode,
 )
 
+# Read-only view of the language configs, shared by every caller
+_LANGS = MappingProxyType(LANGUAGE_CONFIGS)
+_LANG_KEYS = list(_LANGS.keys())
+
+
+
+class TranslationError(Exception):
+    """Raised by TranslationService.translate when the pipeline fails"""
+
+    def __init__(self, original: Exception):
+        super().__init__(original)
+        self.original = original
+
+    def __str__(self):
+        # Formatted only when the message is actually needed
+        return f"Translation failed: {self.original}"
+
 
 class TranslationService:
     """Main translation service orchestrating multiple AI agents"""
@@ -39,15 +60,61 @@ class TranslationService:
         self.cultural_advisor = CulturalAdvisor()
         self.mqm_framework = MQMFramework()
         self.iso_standards = ISOStandards()
+        self.fused_reviewer = FusedReviewQualityAgent(self.mqm_framework.error_categories)
+        self.step_cache = StepCache() if PROCESS_CONFIG["enable_caching"] else None
+
+        # Every agent shares one limit on in-flight LLM calls; each batch call
+        # additionally gets its own MAX_CONCURRENT_BATCH_REQUESTS slots (see
+        # _translate_bounded), so one large batch can't take all LLM slots
+        self._llm_sem = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM_CALLS)
+        for agent in (
+            self.translator,
+            self.reviewer,
+            self.quality_assessor,
+            self.cultural_advisor,
+            self.mqm_framework,
+            self.fused_reviewer,
+        ):
+            agent.llm_semaphore = self._llm_sem
+
+        # Merges translator calls from concurrent requests; started by the app lifespan
+        self.translator_queue = BatchQueue(self.translator)
+
+        # Agents are never reassigned, so the static part of the health status
+        # is computed once; get_health_status only adds a fresh timestamp
+        self._agents_initialized = all(
+            agent is not None
+            for agent in (
+                self.translator,
+                self.reviewer,
+                self.quality_assessor,
+                self.cultural_advisor,
+                self.mqm_framework,
+                self.iso_standards,
+            )
+        )
+        self._health_status = {
+            "status": "healthy",
+            "agents_initialized": self._agents_initialized,
+            "supported_languages": _LANG_KEYS,
+        }
 
-    async def translate(self, request: TranslationRequest) -> TranslationResponse:
-        """Process a single translation request through the optimized multi-agent pipeline"""
+    async def translate(
+        self,
+        request: TranslationRequest,
+        initial_result: Optional[Dict[str, Any]] = None,
+    ) -> TranslationResponse:
+        """Process a single translation request through the optimized multi-agent pipeline
+
+        initial_result, when given, is used instead of running the translator step.
+        """
         start_time = time.time()
-        request_id = str(uuid.uuid4())
+        request_id = secrets.token_hex(16)
+        cultural_task = None
+        mqm_task = None
 
         try:
             # Override request flags based on quality mode
-            from api.models import QualityMode
             quality_mode = request.quality_mode
             
             if quality_mode == QualityMode.FAST:
@@ -66,22 +133,34 @@ class TranslationService:
                 request.include_iso_compliance = False
             # QualityMode.QUALITY keeps all flags as provided
             
+            # Request-only ISO checks run up front; finalize() adds the rest in phase 5
+            iso_partial = None
+            if request.include_iso_compliance:
+                iso_partial = self.iso_standards.validate_static(
+                    request.source_text, request.target_language.value
+                )
+
+            # Pipeline inputs that step cache keys are built from (see PROCESS_CONFIG)
+            step_inputs = {
+                "source_text": request.source_text,
+                "target_language": request.target_language.value,
+                "quality_mode": quality_mode.value,
+            }
+
             # PHASE 1: Initial Translation (always required)
-            initial_result = await self._run_agent_async(
-                self.translator.translate,
-                request.source_text,
-                request.target_language.value,
-            )
-            
-            # Convert to response model
-            initial_translation = TranslationResult(
-                translation=initial_result["translation"],
-                confidence=initial_result["confidence"],
-                translation_notes=initial_result.get("translation_notes", []),
-                difficulty_level=initial_result.get("difficulty_level", "medium"),
-                key_decisions=initial_result.get("key_decisions", []),
-            )
+            if initial_result is None:
+                initial_result = await self._run_cached_step(
+                    "translator",
+                    step_inputs,
+                    self._translate_initial,
+                    request.source_text,
+                    request.target_language.value,
+                )
+
+            step_inputs["initial_translation"] = initial_result["translation"]
 
+            # Raw agent outputs keyed by TranslationResponse field; the response
+            # model is validated once from this dict at the end
             results = {
                 "initial_translation": initial_result,
                 "request_id": request_id,
@@ -89,31 +168,50 @@ class TranslationService:
                 "target_language": request.target_language.value,
             }
 
-            # PHASE 2: Cultural Analysis (if requested)
-            cultural_analysis = None
+            # PHASE 2: Cultural Analysis (if requested). Only the reviewer consumes it,
+            # so it runs as a task and is awaited where its output is first needed.
             if request.include_cultural_analysis:
-                cultural_result = await self._run_agent_async(
-                    self.cultural_advisor.analyze,
+                cultural_task = asyncio.create_task(
+                    self._run_cached_step(
+                        "cultural_advisor",
+                        step_inputs,
+                        self.cultural_advisor.analyze,
+                        request.source_text,
+                        initial_result["translation"],
+                        request.target_language.value,
+                    )
+                )
+
+            if cultural_task and request.include_review:
+                cultural_result = await cultural_task
+                results["cultural_analysis"] = cultural_result
+                step_inputs["cultural_analysis"] = cultural_result
+
+            # PHASE 3-5 (quality mode): review, quality assessment and MQM in one fused call.
+            # Falls through to the step-by-step phases below if the fused call fails.
+            if (
+                quality_mode == QualityMode.QUALITY
+                and request.include_review
+                and request.include_quality_assessment
+                and request.include_mqm_analysis
+            ):
+                fused_result = await self._run_cached_step(
+                    "fused_review_quality",
+                    step_inputs,
+                    self.fused_reviewer.review_and_assess,
                     request.source_text,
                     initial_result["translation"],
+                    results.get("cultural_analysis", {}),
                     request.target_language.value,
                 )
-
-                cultural_analysis = CulturalAnalysis(
-                    cultural_appropriateness=cultural_result["cultural_appropriateness"],
-                    adaptations=cultural_result.get("adaptations", []),
-                    regional_notes=cultural_result.get("regional_notes", []),
-                    register_recommendations=cultural_result.get("register_recommendations", "neutral"),
-                    localization_suggestions=cultural_result.get("localization_suggestions", []),
-                    cultural_risks=cultural_result.get("cultural_risks", []),
-                    target_audience_fit=cultural_result.get("target_audience_fit", "fair"),
-                )
-                results["cultural_analysis"] = cultural_result
+                if fused_result:
+                    results.update(fused_result)
 
             # PHASE 3: Review and Refinement (depends on cultural analysis)
-            refined_translation = None
-            if request.include_review:
-                review_result = await self._run_agent_async(
+            if request.include_review and "refined_translation" not in results:
+                results["refined_translation"] = await self._run_cached_step(
+                    "reviewer",
+                    step_inputs,
                     self.reviewer.review,
                     request.source_text,
                     initial_result["translation"],
@@ -121,152 +219,108 @@ class TranslationService:
                     request.target_language.value,
                 )
 
-                refined_translation = ReviewResult(
-                    final_translation=review_result["final_translation"],
-                    review_comments=review_result.get("review_comments", []),
-                    changes_made=review_result.get("changes_made", []),
-                    confidence_improvement=review_result.get("confidence_improvement", 0),
-                    quality_grade=review_result.get("quality_grade", "C"),
-                )
-                results["refined_translation"] = review_result
-
             # Get final text for quality checks
             final_text = (
-                refined_translation.final_translation
-                if refined_translation
+                results["refined_translation"]["final_translation"]
+                if request.include_review
                 else initial_result["translation"]
             )
-            
+            step_inputs["final_text"] = final_text
+            # Token/sentence statistics shared by the QA and MQM steps
+            analysis_context = AnalysisContext.from_texts(request.source_text, final_text)
+
             # PHASE 4: Quality Assessment (required for MQM)
-            quality_assessment = None
-            if request.include_quality_assessment:
-                quality_result = await self._run_agent_async(
+            if request.include_quality_assessment and "quality_assessment" not in results:
+                quality_call = self._run_cached_step(
+                    "quality_assessor",
+                    step_inputs,
                     self.quality_assessor.assess,
                     request.source_text,
                     final_text,
                     request.target_language.value,
+                    analysis_context,
                 )
-
-                quality_assessment = QualityAssessment(
-                    overall_score=quality_result["overall_score"],
-                    detailed_scores=quality_result["detailed_scores"],
-                    assessment_notes=quality_result.get("assessment_notes", []),
-                    strengths=quality_result.get("strengths", []),
-                    areas_for_improvement=quality_result.get("areas_for_improvement", []),
-                    industry_benchmark_met=quality_result.get("industry_benchmark_met", False),
-                    error_count=quality_result.get("error_count", 0),
-                    errors_per_1000_words=quality_result.get("errors_per_1000_words", 0),
-                )
+                if cultural_task and not cultural_task.done():
+                    # Review is off, so cultural analysis overlaps with QA
+                    quality_result, _ = await asyncio.gather(quality_call, cultural_task)
+                else:
+                    quality_result = await quality_call
                 results["quality_assessment"] = quality_result
+            step_inputs["quality_assessment"] = results.get("quality_assessment")
 
-            # PARALLEL PHASE 5: MQM and ISO (can run in parallel after Quality Assessment)
-            advanced_tasks = []
-            mqm_analysis = None
-            iso_compliance = None
-            
-            # Add MQM analysis task if requested (needs quality assessment)
-            if request.include_mqm_analysis and quality_assessment:
-                advanced_tasks.append(
-                    ("mqm", self._run_agent_async(
+            # PHASE 5: MQM only needs the quality assessment, so it starts
+            # while a still-running cultural analysis finishes
+            if (
+                request.include_mqm_analysis
+                and "mqm_analysis" not in results
+                and "quality_assessment" in results
+            ):
+                mqm_task = asyncio.create_task(
+                    self._run_cached_step(
+                        "mqm_framework",
+                        step_inputs,
                         self.mqm_framework.analyze,
                         request.source_text,
                         final_text,
-                        results.get("quality_assessment", {}),
-                    ))
+                        results["quality_assessment"],
+                        analysis_context,
+                    )
                 )
-            
-            # Add ISO compliance task if requested
+
+            if cultural_task:
+                results["cultural_analysis"] = await cultural_task
+            if mqm_task:
+                results["mqm_analysis"] = await mqm_task
+
+            # ISO compliance scores the outputs of every other step, MQM included
             if request.include_iso_compliance:
-                advanced_tasks.append(
-                    ("iso", self._run_agent_async(
-                        self.iso_standards.validate, results
-                    ))
-                )
-            
-            # Execute advanced quality tasks in parallel if any exist
-            if advanced_tasks:
-                advanced_results = await asyncio.gather(*[task[1] for task in advanced_tasks])
-                
-                # Process results
-                for i, (task_type, _) in enumerate(advanced_tasks):
-                    if task_type == "mqm":
-                        mqm_result = advanced_results[i]
-                        mqm_analysis = MQMAnalysis(
-                            total_score=mqm_result["total_score"],
-                            word_count=mqm_result["word_count"],
-                            errors=mqm_result.get("errors", []),
-                            error_summary=mqm_result["error_summary"],
-                            mqm_grade=mqm_result["mqm_grade"],
-                            industry_compliance=mqm_result["industry_compliance"],
-                        )
-                        results["mqm_analysis"] = mqm_result
-                    
-                    elif task_type == "iso":
-                        iso_result = advanced_results[i]
-                        iso_compliance = ISOCompliance(
-                            compliant=iso_result["compliant"],
-                            score=iso_result["score"],
-                            compliance_areas=iso_result["compliance_areas"],
-                            detailed_scores=iso_result["detailed_scores"],
-                            recommendations=iso_result.get("recommendations", []),
-                            iso_standard=iso_result.get("iso_standard", "ISO 17100:2015"),
-                            assessment_date=iso_result.get("assessment_date", datetime.now().isoformat()),
-                        )
-                        results["iso_compliance"] = iso_result
+                # A few microseconds of dict math: run inline, not in a thread
+                results["iso_compliance"] = self.iso_standards.finalize(iso_partial, results)
 
             processing_time = time.time() - start_time
+            timestamp = datetime.now().isoformat()
 
-            return TranslationResponse(
-                request_id=request_id,
-                source_text=request.source_text,
-                target_language=request.target_language,
-                initial_translation=initial_translation,
-                cultural_analysis=cultural_analysis,
-                refined_translation=refined_translation,
-                quality_assessment=quality_assessment,
-                mqm_analysis=mqm_analysis,
-                iso_compliance=iso_compliance,
-                processing_time=processing_time,
-                timestamp=datetime.now().isoformat(),
+            return TranslationResponse.model_validate(
+                {
+                    **results,
+                    "processing_time": processing_time,
+                    "timestamp": timestamp,
+                }
             )
 
         except Exception as e:
-            processing_time = time.time() - start_time
-            raise Exception(f"Translation failed: {str(e)}")
+            for task in (cultural_task, mqm_task):
+                if task and not task.done():
+                    task.cancel()
+            raise TranslationError(e) from e
 
     async def translate_batch(
         self, requests: list[TranslationRequest]
     ) -> BatchTranslationResponse:
         """Process multiple translation requests"""
         start_time = time.time()
-        batch_id = str(uuid.uuid4())
+        batch_id = secrets.token_hex(16)
 
-        # Process translations in parallel
-        tasks = [self.translate(req) for req in requests]
+        # Initial translations are merged per target language, the rest of
+        # each pipeline runs in parallel, bounded by MAX_CONCURRENT_BATCH_REQUESTS
+        initial_results = await self._batch_initial_translations(requests)
+        batch_sem = asyncio.Semaphore(settings.MAX_CONCURRENT_BATCH_REQUESTS)
+        tasks = [
+            self._translate_bounded(batch_sem, req, initial_results.get(i))
+            for i, req in enumerate(requests)
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Separate successful and failed results
         successful_results = []
         error_count = 0
+        timestamp = datetime.now().isoformat()
 
         for i, result in enumerate(results):
             if isinstance(result, Exception):
                 error_count += 1
                 # Create error response for failed translation
-                error_response = TranslationResponse(
-                    request_id=str(uuid.uuid4()),
-                    source_text=requests[i].source_text,
-                    target_language=requests[i].target_language,
-                    initial_translation=TranslationResult(
-                        translation=f"Translation failed: {str(result)}",
-                        confidence=0,
-                        translation_notes=["Error in translation process"],
-                        difficulty_level="error",
-                        key_decisions=[],
-                    ),
-                    processing_time=0,
-                    timestamp=datetime.now().isoformat(),
-                )
+                error_response = self._error_response(requests[i], result, timestamp)
                 successful_results.append(error_response)
             else:
                 successful_results.append(result)
@@ -279,34 +333,136 @@ class TranslationService:
             total_processing_time=total_processing_time,
             success_count=len(requests) - error_count,
             error_count=error_count,
-            timestamp=datetime.now().isoformat(),
+            timestamp=timestamp,
         )
 
-    async def _run_agent_async(self, agent_func, *args, **kwargs):
-        """Run agent function asynchronously"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, agent_func, *args, **kwargs)
+    async def translate_batch_stream(
+        self, requests: list[TranslationRequest]
+    ) -> AsyncIterator[Tuple[int, TranslationResponse]]:
+        """Yield (index, response) for each batch item as soon as it completes
 
-    def get_supported_languages(self) -> Dict[str, Any]:
-        """Get list of supported languages and their configurations"""
-        from config.agent_config import LANGUAGE_CONFIGS
+        Items arrive in completion order; failed items yield an error response
+        like translate_batch does.
+        """
+        initial_results = await self._batch_initial_translations(requests)
+        batch_sem = asyncio.Semaphore(settings.MAX_CONCURRENT_BATCH_REQUESTS)
+
+        async def run(i: int, request: TranslationRequest) -> Tuple[int, TranslationResponse]:
+            try:
+                return i, await self._translate_bounded(batch_sem, request, initial_results.get(i))
+            except Exception as e:
+                return i, self._error_response(request, e, datetime.now().isoformat())
+
+        tasks = [asyncio.create_task(run(i, req)) for i, req in enumerate(requests)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer went away (e.g. client disconnected): stop the rest
+            for task in tasks:
+                task.cancel()
+
+    def _error_response(
+        self, request: TranslationRequest, error: Exception, timestamp: str
+    ) -> TranslationResponse:
+        """Placeholder response for a batch item whose translation failed"""
+        return TranslationResponse(
+            request_id=secrets.token_hex(16),
+            source_text=request.source_text,
+            target_language=request.target_language,
+            initial_translation=TranslationResult(
+                translation=(
+                    str(error)
+                    if isinstance(error, TranslationError)
+                    else f"Translation failed: {error}"
+                ),
+                confidence=0,
+                translation_notes=["Error in translation process"],
+                difficulty_level="error",
+                key_decisions=[],
+            ),
+            processing_time=0,
+            timestamp=timestamp,
+        )
+
+    async def _translate_initial(self, source_text: str, target_language: str) -> Dict[str, Any]:
+        """Translator step, merged with concurrent requests when the batch queue runs"""
+        if self.translator_queue.running:
+            return await self.translator_queue.submit(source_text, target_language)
+        return await self.translator.translate(source_text, target_language)
+
+    async def _run_cached_step(self, step, step_inputs, agent_func, *args):
+        """Run an agent step, reusing the cached result when its key inputs match"""
+        key = self.step_cache.make_key(step, step_inputs) if self.step_cache else None
+        if key is not None:
+            cached = self.step_cache.get(key)
+            if cached is not None:
+                return cached
+
+        result = await agent_func(*args)
+
+        # Failed calls (agent fallbacks, None from the fused agent, or results
+        # missing required keys) are not cached
+        if (
+            key is not None
+            and not isinstance(result, FallbackResult)
+            and self.step_cache.is_complete(step, result)
+        ):
+            self.step_cache.set(key, result)
+        return result
 
-        return LANGUAGE_CONFIGS
+    async def _translate_bounded(
+        self,
+        batch_sem: asyncio.Semaphore,
+        request: TranslationRequest,
+        initial_result: Optional[Dict[str, Any]] = None,
+    ) -> TranslationResponse:
+        """Translate one batch item while holding one of its batch's concurrency slots"""
+        async with batch_sem:
+            return await self.translate(request, initial_result)
+
+    async def _batch_initial_translations(
+        self, requests: list[TranslationRequest]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Run the translator step for batch items in merged calls per target language
+
+        Returns initial translations by request index. Items that end up alone in
+        their group, or whose merged reply can't be split back, are left out and
+        go through the regular per-item translator step.
+        """
+        chunks = [
+            (language, chunk)
+            for language, chunk in group_for_batching(
+                [(req.source_text, req.target_language.value) for req in requests],
+                TranslatorAgent.BATCH_DELIMITER,
+            )
+            if len(chunk) > 1
+        ]
+
+        replies = await asyncio.gather(
+            *[
+                self.translator.translate_batch(
+                    [requests[i].source_text for i in chunk], language
+                )
+                for language, chunk in chunks
+            ]
+        )
+
+        initial_results = {}
+        for (_, chunk), reply in zip(chunks, replies):
+            if reply is not None:
+                initial_results.update(zip(chunk, reply))
+        return initial_results
+
+    async def shutdown(self):
+        """Stop background batching and release the HTTP pool"""
+        await self.translator_queue.stop()
+        await close_openai_client()
+
+    def get_supported_languages(self) -> Mapping[str, Any]:
+        """Get list of supported languages and their configurations"""
+        return _LANGS
 
     def get_health_status(self) -> Dict[str, Any]:
         """Get service health status"""
-        return {
-            "status": "healthy",
-            "agents_initialized": all(
-                [
-                    self.translator is not None,
-                    self.reviewer is not None,
-                    self.quality_assessor is not None,
-                    self.cultural_advisor is not None,
-                    self.mqm_framework is not None,
-                    self.iso_standards is not None,
-                ]
-            ),
-            "supported_languages": list(self.get_supported_languages().keys()),
-            "timestamp": datetime.now().isoformat(),
-        }
+        return {**self._health_status, "timestamp": datetime.now().isoformat()}
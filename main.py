@@ -1,7 +1,8 @@
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import os
 from dotenv import load_dotenv
 
@@ -15,14 +16,32 @@ load_dotenv()
 # Global service instance
 translation_service = None
 
+async def keep_llm_connection_alive(interval: int):
+    """Periodically touch the provider so pooled connections aren't dropped as idle"""
+    while True:
+        await asyncio.sleep(interval)
+        await translation_service.translator.warmup()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     global translation_service
     # Startup
     translation_service = TranslationService()
+    if settings.TRANSLATOR_BATCHING_ENABLED:
+        translation_service.translator_queue.start()
+    keepalive_task = None
+    if settings.LLM_WARMUP_ENABLED:
+        await translation_service.translator.warmup()
+        if settings.LLM_KEEPALIVE_SECONDS > 0:
+            keepalive_task = asyncio.create_task(
+                keep_llm_connection_alive(settings.LLM_KEEPALIVE_SECONDS)
+            )
     yield
     # Shutdown
+    if keepalive_task is not None:
+        keepalive_task.cancel()
+    await translation_service.shutdown()
     translation_service = None
 
 # Create FastAPI app 
@@ -33,6 +52,7 @@ app = FastAPI(
     root_path="/translation-service",
     version="1.0.0",
     # docs_url="/translation-service/docs",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -64,7 +84,7 @@ async def root():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
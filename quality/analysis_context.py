@@ -0,0 +1,48 @@
+"""
+Text statistics shared by the quality checks of one translation
+"""
+
+import re
+from dataclasses import dataclass
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+def _sentences(text):
+    return tuple(sentence for sentence in _SENTENCE_BOUNDARY.split(text.strip()) if sentence)
+
+
+@dataclass(slots=True, frozen=True)
+class AnalysisContext:
+    """Tokens and sentences of a source/translation pair, computed once per request
+
+    The quality assessor and the MQM framework both need word counts; building
+    them here keeps the numbers identical across agents instead of leaving each
+    LLM to count on its own.
+    """
+
+    source_tokens: tuple
+    target_tokens: tuple
+    source_sentences: tuple
+    target_sentences: tuple
+
+    @classmethod
+    def from_texts(cls, source_text, translation):
+        return cls(
+            source_tokens=tuple(source_text.split()),
+            target_tokens=tuple(translation.split()),
+            source_sentences=_sentences(source_text),
+            target_sentences=_sentences(translation),
+        )
+
+    @property
+    def word_count(self):
+        """Source word count, the basis for errors per 1000 words"""
+        return len(self.source_tokens)
+
+    def prompt_summary(self):
+        """Pre-computed counts to include in an agent prompt"""
+        return (
+            f"Source: {self.word_count} words, {len(self.source_sentences)} sentences. "
+            f"Translation: {len(self.target_tokens)} words, {len(self.target_sentences)} sentences."
+        )
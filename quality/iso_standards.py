@@ -1,4 +1,11 @@
-import json
+from datetime import date
+
+from config.agent_config import LANGUAGE_CONFIGS
+
+# Agent outputs whose presence shows the multi-agent process was followed
+_PIPELINE_OUTPUTS = frozenset(
+    {'initial_translation', 'cultural_analysis', 'refined_translation', 'quality_assessment'}
+)
 
 class ISOStandards:
     """ISO 17100:2015 Translation Services Requirements compliance validator"""
@@ -27,45 +34,54 @@ class ISOStandards:
                 "criteria": ["requirements_analysis", "target_audience", "purpose_fitness"]
             }
         }
+        
+        # (report name, evaluator, weight) per area, in report order
+        self._area_evaluators = tuple(
+            (
+                requirement.replace("_", " ").title(),
+                getattr(self, f"_evaluate_{requirement}"),
+                config["weight"],
+            )
+            for requirement, config in self.iso_requirements.items()
+        )
     
     def validate(self, translation_results):
         """Validate translation process against ISO 17100:2015 standards"""
-        
-        compliance_scores = {}
-        total_weighted_score = 0
-        
-        # Evaluate Translation Competence
-        translation_competence = self._evaluate_translation_competence(translation_results)
-        compliance_scores["Translation Competence"] = translation_competence
-        total_weighted_score += translation_competence * self.iso_requirements["translation_competence"]["weight"]
-        
-        # Evaluate Quality Assurance
-        quality_assurance = self._evaluate_quality_assurance(translation_results)
-        compliance_scores["Quality Assurance"] = quality_assurance
-        total_weighted_score += quality_assurance * self.iso_requirements["quality_assurance"]["weight"]
-        
-        # Evaluate Project Management
-        project_management = self._evaluate_project_management(translation_results)
-        compliance_scores["Project Management"] = project_management
-        total_weighted_score += project_management * self.iso_requirements["project_management"]["weight"]
-        
-        # Evaluate Technical Resources
-        technical_resources = self._evaluate_technical_resources(translation_results)
-        compliance_scores["Technical Resources"] = technical_resources
-        total_weighted_score += technical_resources * self.iso_requirements["technical_resources"]["weight"]
-        
-        # Evaluate Client Requirements
-        client_requirements = self._evaluate_client_requirements(translation_results)
-        compliance_scores["Client Requirements"] = client_requirements  
-        total_weighted_score += client_requirements * self.iso_requirements["client_requirements"]["weight"]
-        
+        partial = self.validate_static(
+            translation_results.get("source_text", ""),
+            translation_results.get("target_language", ""),
+        )
+        return self.finalize(partial, translation_results)
+
+    def validate_static(self, source_text, target_language):
+        """Checks that only depend on the request, available before any agent runs"""
+        recommendations = []
+        if target_language not in LANGUAGE_CONFIGS:
+            recommendations.append(
+                f"Define a linguistic profile for {target_language or 'the target language'} to meet ISO 17100:2015 client requirements"
+            )
+        if not source_text.strip():
+            recommendations.append("Provide source text so the translation can be verified against it")
+
+        return {
+            "recommendations": recommendations,
+            "iso_standard": "ISO 17100:2015",
+            "assessment_date": date.today().isoformat(),
+        }
+
+    def finalize(self, partial, translation_results):
+        """Complete a validate_static result with the checks that need agent output"""
+
+        signals = self._signals(translation_results)
+        compliance_scores, total_weighted_score = self._compliance_scores(signals)
+
         # Calculate overall compliance
         overall_score = total_weighted_score * 100
         is_compliant = overall_score >= 85  # Industry standard for ISO compliance
         
         # Generate compliance report
         compliance_areas = {}
-        recommendations = []
+        recommendations = list(partial["recommendations"])
         
         for area, score in compliance_scores.items():
             compliance_areas[area] = score >= 0.85
@@ -76,106 +92,132 @@ class ISOStandards:
             "compliant": is_compliant,
             "score": overall_score,
             "compliance_areas": compliance_areas,
-            "detailed_scores": compliance_scores,
+            "detailed_scores": dict(compliance_scores),
             "recommendations": recommendations,
-            "iso_standard": "ISO 17100:2015",
-            "assessment_date": "2025-09-20"
+            "iso_standard": partial["iso_standard"],
+            "assessment_date": partial["assessment_date"],
         }
+
+    def _signals(self, results):
+        """The result fields the area evaluators read, looked up once"""
+        # `or {}` also covers steps that are present but produced None
+        quality = results.get('quality_assessment') or {}
+        detailed_scores = quality.get('detailed_scores') or {}
+        cultural = results.get('cultural_analysis') or {}
+        mqm = results.get('mqm_analysis') or {}
+        refined = results.get('refined_translation') or {}
+        return {
+            'has_initial_translation': 'initial_translation' in results,
+            'has_refined_translation': 'refined_translation' in results,
+            'has_quality_assessment': 'quality_assessment' in results,
+            'agent_count': len(_PIPELINE_OUTPUTS & results.keys()),
+            'has_review_comments': len(refined.get('review_comments') or []) > 0,
+            'grammar': detailed_scores.get('grammar', 0),
+            'vocabulary': detailed_scores.get('vocabulary', 0),
+            'overall_quality': quality.get('overall_score', 0),
+            'cultural_appropriateness': cultural.get('cultural_appropriateness'),
+            'target_audience_fit': cultural.get('target_audience_fit'),
+            'mqm_total_score': mqm.get('total_score', 0),
+            'terminology_errors': (mqm.get('error_summary') or {}).get('terminology_errors', 999),
+        }
+
+    def _compliance_scores(self, signals):
+        """Per-area scores and their weighted total"""
+        compliance_scores = {}
+        total_weighted_score = 0
+        for area, evaluate, weight in self._area_evaluators:
+            score = evaluate(signals)
+            compliance_scores[area] = score
+            total_weighted_score += score * weight
+        
+        return compliance_scores, total_weighted_score
     
-    def _evaluate_translation_competence(self, results):
+    def _evaluate_translation_competence(self, signals):
         """Evaluate translator competence based on output quality"""
         competence_score = 0
         
         # Linguistic competence (40%)
-        if results.get('quality_assessment', {}).get('detailed_scores', {}).get('grammar', 0) >= 85:
+        if signals['grammar'] >= 85:
             competence_score += 0.4
         
         # Cultural competence (35%)
-        cultural_analysis = results.get('cultural_analysis', {})
-        if cultural_analysis.get('cultural_appropriateness') in ['high', 'medium']:
+        if signals['cultural_appropriateness'] in ['high', 'medium']:
             competence_score += 0.35
         
         # Domain expertise (25%)
-        overall_quality = results.get('quality_assessment', {}).get('overall_score', 0)
-        if overall_quality >= 85:
+        if signals['overall_quality'] >= 85:
             competence_score += 0.25
             
         return min(competence_score, 1.0)
     
-    def _evaluate_quality_assurance(self, results):
+    def _evaluate_quality_assurance(self, signals):
         """Evaluate quality assurance processes"""
         qa_score = 0
         
         # Review process implemented (50%)
-        if 'refined_translation' in results:
+        if signals['has_refined_translation']:
             qa_score += 0.5
         
         # Error detection capability (30%)
-        mqm_analysis = results.get('mqm_analysis', {})
-        if mqm_analysis.get('total_score', 0) >= 80:
+        if signals['mqm_total_score'] >= 80:
             qa_score += 0.3
         
         # Quality metrics available (20%)
-        if 'quality_assessment' in results:
+        if signals['has_quality_assessment']:
             qa_score += 0.2
             
         return min(qa_score, 1.0)
     
-    def _evaluate_project_management(self, results):
+    def _evaluate_project_management(self, signals):
         """Evaluate project management standards"""
         pm_score = 0
         
         # Process documentation (40%)
-        if len(results.get('refined_translation', {}).get('review_comments', [])) > 0:
+        if signals['has_review_comments']:
             pm_score += 0.4
         
         # Resource allocation (30%) - Multi-agent approach
-        agent_count = sum(1 for key in results.keys() 
-                         if key in ['initial_translation', 'cultural_analysis', 'refined_translation', 'quality_assessment'])
-        if agent_count >= 4:
+        if signals['agent_count'] >= 4:
             pm_score += 0.3
         
         # Delivery standards (30%)
-        overall_quality = results.get('quality_assessment', {}).get('overall_score', 0)
-        if overall_quality >= 85:
+        if signals['overall_quality'] >= 85:
             pm_score += 0.3
             
         return min(pm_score, 1.0)
     
-    def _evaluate_technical_resources(self, results):
+    def _evaluate_technical_resources(self, signals):
         """Evaluate technical resource utilization"""
         tech_score = 0
         
         # Tools usage (40%) - AI-powered translation
-        if 'initial_translation' in results:
+        if signals['has_initial_translation']:
             tech_score += 0.4
         
         # Terminology management (35%)
-        quality_scores = results.get('quality_assessment', {}).get('detailed_scores', {})
-        if quality_scores.get('vocabulary', 0) >= 85:
+        if signals['vocabulary'] >= 85:
             tech_score += 0.35
         
         # Consistency checks (25%)
-        if results.get('mqm_analysis', {}).get('error_summary', {}).get('terminology_errors', 999) <= 2:
+        if signals['terminology_errors'] <= 2:
             tech_score += 0.25
             
         return min(tech_score, 1.0)
     
-    def _evaluate_client_requirements(self, results):
+    def _evaluate_client_requirements(self, signals):
         """Evaluate client requirement fulfillment"""
         client_score = 0
         
         # Requirements analysis (40%) - Cultural adaptation
-        if results.get('cultural_analysis', {}).get('target_audience_fit') in ['excellent', 'good']:
+        if signals['target_audience_fit'] in ['excellent', 'good']:
             client_score += 0.4
         
         # Target audience consideration (35%)
-        cultural_analysis = results.get('cultural_analysis', {})
-        if cultural_analysis.get('cultural_appropriateness') == 'high':
+        if signals['cultural_appropriateness'] == 'high':
             client_score += 0.35
         
         # Purpose fitness (25%)
-        overall_quality = results.get('quality_assessment', {}).get('overall_score', 0)
+        overall_quality = signals['overall_quality']
         if overall_quality >= 90:
             client_score += 0.25
         elif overall_quality >= 85:
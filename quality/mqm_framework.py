@@ -1,13 +1,18 @@
+import asyncio
 import json
-import os
-from openai import OpenAI
 
-class MQMFramework:
+import orjson
 
+from agents.base_agent import BaseAgent, FallbackResult
+from config.agent_config import PROCESS_CONFIG
+from quality.analysis_context import AnalysisContext
+
+class MQMFramework(BaseAgent):
+    # total_score and error_summary are derived by _fill_scores when missing
+    REQUIRED_KEYS = ("mqm_grade", "industry_compliance")
     
     def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.model = "gpt-5"
+        super().__init__()
         
 
         self.error_categories = {
@@ -33,11 +38,83 @@ class MQMFramework:
                 "wrong_term": {"minor": -1, "major": -5, "critical": -15}
             }
         }
+        # Static rubric; built once instead of re-serializing the penalties per call
+        self._system_prompt = self._build_system_prompt()
     
-    def analyze(self, source_text, translation, quality_assessment):
+    async def analyze(self, source_text, translation, quality_assessment, ctx=None):
         """Perform MQM analysis on the translation"""
+        if ctx is None:
+            ctx = AnalysisContext.from_texts(source_text, translation)
+        system_prompt, user_prompt = self._build_prompts(source_text, translation, quality_assessment, ctx)
+        try:
+            result = self._clamp_score(self._fill_scores(await self._call_llm(system_prompt, user_prompt)))
+            result["word_count"] = ctx.word_count
+            return result
+        except Exception as e:
+            return self._fallback(e, ctx)
+
+    async def analyze_batch(self, items):
+        """Run MQM analysis on several (source_text, translation, quality_assessment) items in one LLM call
+
+        Returns one result per item, in order. Items whose entry in the merged
+        reply is missing or unusable are analyzed on their own instead.
+        """
+        if len(items) == 1:
+            return [await self.analyze(*items[0])]
+
+        contexts = [AnalysisContext.from_texts(source_text, translation) for source_text, translation, _ in items]
+        user_prompt = self._build_batch_prompt(items, contexts)
+        try:
+            entries = (await self._call_llm(self._system_prompt, user_prompt, required_keys=("results",)))["results"]
+        except Exception:
+            entries = None
+        if not isinstance(entries, list) or len(entries) != len(items):
+            entries = [None] * len(items)
+
+        results = [None] * len(items)
+        retry = []
+        for i, (entry, ctx) in enumerate(zip(entries, contexts)):
+            if isinstance(entry, dict) and isinstance(entry.get("total_score"), (int, float)):
+                results[i] = self._clamp_score(self._fill_scores(entry))
+                results[i]["word_count"] = ctx.word_count
+            else:
+                retry.append(i)
+
+        if retry:
+            retried = await asyncio.gather(*[self.analyze(*items[i], contexts[i]) for i in retry])
+            for i, result in zip(retry, retried):
+                results[i] = result
+        return results
+
+    def _build_batch_prompt(self, items, contexts):
+        """Build one user prompt covering every item of a batch"""
+        segments = "\n".join(
+            f"""
+        SEGMENT {i}:
+        SOURCE TEXT (English):
+        "{source_text}"
+        TRANSLATION (Swedish):
+        "{translation}"
+        WORD COUNTS (pre-computed): {ctx.prompt_summary()}
+        QUALITY ASSESSMENT CONTEXT:
+        {orjson.dumps(quality_assessment, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()}"""
+            for i, ((source_text, translation, quality_assessment), ctx) in enumerate(zip(items, contexts), 1)
+        )
+        return f"""Perform MQM (Multidimensional Quality Metrics) analysis on each of these {len(items)} independent translations:
+        {segments}
+        
+        Instructions:
+        1. Analyze every segment on its own; errors in one segment do not affect another
+        2. Identify all errors according to MQM categories and assign severity levels (minor/major/critical)
+        3. Calculate penalty points for each error and the total MQM score (start at 100, subtract penalties)
+        4. Assign MQM grade: A (90-100), B (80-89), C (70-79), D (60-69), F (<60)
+        5. Assess industry compliance (>= 85 score = compliant)
+        6. List at most {PROCESS_CONFIG["mqm_max_listed_errors"]} errors per segment, most severe first; total_score and error_summary must still account for every error found
         
-        system_prompt = f"""You are an MQM (Multidimensional Quality Metrics) expert for translation evaluation.
+        Return {{"results": [...]}} with exactly {len(items)} MQM analyses in segment order, each in the JSON format above."""
+
+    def _build_system_prompt(self):
+        return f"""You are an MQM (Multidimensional Quality Metrics) expert for translation evaluation.
 
         MQM Framework Error Categories:
         
@@ -94,6 +171,9 @@ class MQMFramework:
             "mqm_grade": "A|B|C|D|F",
             "industry_compliance": true_or_false
         }}"""
+
+    def _build_prompts(self, source_text, translation, quality_assessment, ctx):
+        """Build the MQM system and user prompts"""
         
         user_prompt = f"""Perform MQM (Multidimensional Quality Metrics) analysis on this translation:
 
@@ -103,8 +183,10 @@ class MQMFramework:
         TRANSLATION (Swedish):
         "{translation}"
         
+        WORD COUNTS (pre-computed): {ctx.prompt_summary()}
+
         QUALITY ASSESSMENT CONTEXT:
-        {json.dumps(quality_assessment, ensure_ascii=False, indent=2)}
+        {orjson.dumps(quality_assessment, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()}
         
         Instructions:
         1. Identify all errors according to MQM categories
@@ -113,53 +195,63 @@ class MQMFramework:
         4. Determine total MQM score (start at 100, subtract penalties)
         5. Assign MQM grade: A (90-100), B (80-89), C (70-79), D (60-69), F (<60)
         6. Assess industry compliance (>= 85 score = compliant)
+        7. List at most {PROCESS_CONFIG["mqm_max_listed_errors"]} errors, most severe first; total_score and error_summary must still account for every error found
         
         Be thorough but fair in error detection. Focus on errors that actually impact quality."""
         
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"}
-            )
-            
-            content = response.choices[0].message.content
-            if content is None:
-                raise ValueError("No content received from OpenAI API")
-            result = json.loads(content)
-            
-            # Validate and ensure reasonable scoring
-            if result.get("total_score", 0) > 100:
-                result["total_score"] = 100
-            elif result.get("total_score", 0) < 0:
-                result["total_score"] = 0
-                
+        return self._system_prompt, user_prompt
+
+    def _fill_scores(self, result):
+        """Derive total_score / error_summary from the error list when the model omits them"""
+        if "total_score" in result and "error_summary" in result:
             return result
+
+        penalty_total = 0.0
+        category_counts = dict.fromkeys(self.error_categories, 0)
+        errors = result.get("errors", [])
+        for error in errors:
+            penalty_total += error.get("penalty", 0)
+            category = error.get("category")
+            if category in category_counts:
+                category_counts[category] += 1
+
+        result.setdefault("total_score", 100 + penalty_total)
+        result.setdefault("error_summary", {
+            "total_errors": len(errors),
+            **{f"{category}_errors": count for category, count in category_counts.items()},
+        })
+        return result
+
+    def _clamp_score(self, result):
+        # Validate and ensure reasonable scoring
+        if result.get("total_score", 0) > 100:
+            result["total_score"] = 100
+        elif result.get("total_score", 0) < 0:
+            result["total_score"] = 0
             
-        except Exception as e:
-            return {
-                "total_score": 0,
-                "word_count": len(source_text.split()),
-                "errors": [
-                    {
-                        "category": "system",
-                        "subcategory": "analysis_failure", 
-                        "severity": "critical",
-                        "description": f"MQM analysis failed: {str(e)}",
-                        "penalty": -100,
-                        "location": "system error"
-                    }
-                ],
-                "error_summary": {
-                    "total_errors": 1,
-                    "accuracy_errors": 0,
-                    "fluency_errors": 0,
-                    "style_errors": 0,
-                    "terminology_errors": 0
-                },
-                "mqm_grade": "F",
-                "industry_compliance": False
-            }
+        return result
+
+    def _fallback(self, e, ctx):
+        return FallbackResult({
+            "total_score": 0,
+            "word_count": ctx.word_count,
+            "errors": [
+                {
+                    "category": "system",
+                    "subcategory": "analysis_failure", 
+                    "severity": "critical",
+                    "description": f"MQM analysis failed: {str(e)}",
+                    "penalty": -100,
+                    "location": "system error"
+                }
+            ],
+            "error_summary": {
+                "total_errors": 1,
+                "accuracy_errors": 0,
+                "fluency_errors": 0,
+                "style_errors": 0,
+                "terminology_errors": 0
+            },
+            "mqm_grade": "F",
+            "industry_compliance": False
+        })
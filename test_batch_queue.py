@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Offline tests for translator batching, using a stubbed OpenAI client
+"""
+
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from agents.translator_agent import TranslatorAgent
+from core.batch_queue import BatchQueue, group_for_batching
+
+
+class StubClient:
+    """Stands in for AsyncOpenAI, answering chat completions from a list of replies"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.requests.append(kwargs)
+        reply = self.replies.pop(0)
+        content = reply if isinstance(reply, str) else json.dumps(reply)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def stub_client(*replies):
+    client = StubClient(*replies)
+    return client, mock.patch("agents.base_agent.get_openai_client", return_value=client)
+
+
+class GroupForBatchingTest(unittest.TestCase):
+    def test_groups_by_language(self):
+        items = [("a", "swedish"), ("b", "dutch"), ("c", "swedish")]
+        chunks = group_for_batching(items, "%%")
+        self.assertEqual(sorted(chunks), [("dutch", [1]), ("swedish", [0, 2])])
+
+    def test_respects_max_items_and_chars(self):
+        items = [("x" * n, "swedish") for n in (1, 2, 3, 4, 5)]
+        self.assertEqual(
+            [chunk for _, chunk in group_for_batching(items, "%%", max_items=2)],
+            [[0, 1], [2, 3], [4]],
+        )
+        self.assertEqual(
+            [chunk for _, chunk in group_for_batching(items, "%%", max_chars=6)],
+            [[0, 1, 2], [3], [4]],
+        )
+
+    def test_oversized_item_gets_own_chunk(self):
+        items = [("x" * 50, "swedish"), ("y", "swedish")]
+        self.assertEqual(sorted(chunk for _, chunk in group_for_batching(items, "%%", max_chars=10)), [[0], [1]])
+
+    def test_text_containing_delimiter_is_never_merged(self):
+        items = [("a %% b", "swedish"), ("c", "swedish"), ("d", "swedish")]
+        self.assertEqual(sorted(group_for_batching(items, "%%")), [("swedish", [0]), ("swedish", [1, 2])])
+
+
+class TranslateBatchTest(unittest.IsolatedAsyncioTestCase):
+    async def test_maps_entries_to_segments(self):
+        client, patcher = stub_client({
+            "translations": [
+                {"translation": "Hej", "confidence": 95, "translation_notes": ["greeting"]},
+                {"translation": "Hejdå", "confidence": 80, "translation_notes": []},
+            ]
+        })
+        with patcher:
+            results = await TranslatorAgent().translate_batch(["Hello", "Goodbye"], "swedish")
+
+        self.assertEqual(len(client.requests), 1)
+        self.assertEqual([r["translation"] for r in results], ["Hej", "Hejdå"])
+        self.assertEqual([r["confidence"] for r in results], [95, 80])
+        self.assertEqual(results[0]["translation_notes"], ["greeting"])
+
+    async def test_wrong_segment_count_returns_none(self):
+        _, patcher = stub_client({"translations": [{"translation": "Hej", "confidence": 95}]})
+        with patcher:
+            self.assertIsNone(await TranslatorAgent().translate_batch(["Hello", "Goodbye"], "swedish"))
+
+    async def test_incomplete_entry_returns_none(self):
+        _, patcher = stub_client({"translations": [{"translation": "Hej", "confidence": 95}, {"translation": "Hejdå"}]})
+        with patcher:
+            self.assertIsNone(await TranslatorAgent().translate_batch(["Hello", "Goodbye"], "swedish"))
+
+    async def test_malformed_reply_returns_none(self):
+        _, patcher = stub_client("not json")
+        with patcher:
+            self.assertIsNone(await TranslatorAgent().translate_batch(["Hello", "Goodbye"], "swedish"))
+
+
+class BatchQueueTest(unittest.IsolatedAsyncioTestCase):
+    async def _run_queue(self, client, texts, batch_size=10):
+        queue = BatchQueue(TranslatorAgent(), batch_size=batch_size, flush_interval_ms=20)
+        queue.start()
+        try:
+            futures = [queue.submit(text, language) for text, language in texts]
+            return await asyncio.wait_for(asyncio.gather(*futures), 5)
+        finally:
+            await queue.stop()
+
+    async def test_concurrent_calls_share_one_request(self):
+        client, patcher = stub_client({
+            "translations": [
+                {"translation": "Hej", "confidence": 95},
+                {"translation": "Hejdå", "confidence": 80},
+            ]
+        })
+        with patcher:
+            # Shorter text first once length-sorted, so submit in the other order
+            results = await self._run_queue(client, [("Goodbye", "swedish"), ("Hello", "swedish")])
+
+        self.assertEqual(len(client.requests), 1)
+        self.assertEqual([r["translation"] for r in results], ["Hejdå", "Hej"])
+
+    async def test_languages_are_dispatched_separately(self):
+        client, patcher = stub_client(
+            {"translation": "Hej", "confidence": 95},
+            {"translation": "Hallo", "confidence": 90},
+        )
+        with patcher:
+            results = await self._run_queue(client, [("Hello", "swedish"), ("Hello", "dutch")])
+
+        self.assertEqual(len(client.requests), 2)
+        self.assertEqual({r["translation"] for r in results}, {"Hej", "Hallo"})
+
+    async def test_unsplittable_reply_falls_back_to_single_calls(self):
+        client, patcher = stub_client(
+            {"translations": [{"translation": "Hej", "confidence": 95}]},
+            {"translation": "Hej", "confidence": 95},
+            {"translation": "Hejdå", "confidence": 80},
+        )
+        with patcher:
+            results = await self._run_queue(client, [("Hello", "swedish"), ("Goodbye", "swedish")])
+
+        self.assertEqual(len(client.requests), 3)
+        self.assertEqual([r["translation"] for r in results], ["Hej", "Hejdå"])
+
+    async def test_stop_cancels_queued_calls(self):
+        client, patcher = stub_client()
+        with patcher:
+            queue = BatchQueue(TranslatorAgent())
+            queue.start()
+            futures = [queue.submit("Hello", "swedish"), queue.submit("Goodbye", "swedish")]
+            await queue.stop()
+
+        self.assertFalse(queue.running)
+        self.assertTrue(all(future.cancelled() for future in futures))
+        self.assertEqual(client.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the per-client token bucket rate limiter
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from fastapi import HTTPException
+
+from core import rate_limiter as rate_limiter_module
+from core.rate_limiter import RateLimiter, enforce_rate_limit
+
+
+class TokenBucketTest(unittest.TestCase):
+    """In-process buckets, with the clock patched"""
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(rate_limiter_module.time, "monotonic", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # 60 per minute: one token per second
+        self.limiter = RateLimiter(rate_per_minute=60, burst=3)
+
+    def test_burst_then_reject(self):
+        self.assertEqual([self.limiter.allow("a") for _ in range(4)], [True, True, True, False])
+
+    def test_refill_over_time(self):
+        for _ in range(3):
+            self.limiter.allow("a")
+        self.assertFalse(self.limiter.allow("a"))
+
+        self.now += 0.5
+        self.assertFalse(self.limiter.allow("a"))
+        self.now += 0.5
+        self.assertTrue(self.limiter.allow("a"))
+        self.assertFalse(self.limiter.allow("a"))
+
+    def test_refill_is_capped_at_burst(self):
+        self.limiter.allow("a")
+        self.now += 3600
+        self.assertEqual([self.limiter.allow("a") for _ in range(4)], [True, True, True, False])
+
+    def test_clients_have_separate_buckets(self):
+        for _ in range(3):
+            self.limiter.allow("a")
+        self.assertFalse(self.limiter.allow("a"))
+        self.assertTrue(self.limiter.allow("b"))
+
+    def test_idle_buckets_are_pruned(self):
+        self.limiter.MAX_TRACKED_CLIENTS = 2
+        self.limiter.allow("a")
+        self.now += 10
+        self.limiter.allow("b")
+        self.limiter.allow("c")
+        self.assertEqual(set(self.limiter._buckets), {"b", "c"})
+
+
+class SharedTokenBucketTest(unittest.TestCase):
+    """Buckets kept in SQLite, shared by every limiter using the same file"""
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch.object(rate_limiter_module.time, "time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "rate_limits.db")
+
+    def _limiter(self):
+        limiter = RateLimiter(rate_per_minute=60, burst=3, database_path=self.path)
+        self.addCleanup(limiter.close)
+        return limiter
+
+    def test_workers_share_buckets(self):
+        first, second = self._limiter(), self._limiter()
+        self.assertTrue(first.shared)
+        allowed = [first.allow("a"), second.allow("a"), first.allow("a"), second.allow("a")]
+        self.assertEqual(allowed, [True, True, True, False])
+
+    def test_refill_over_time(self):
+        limiter = self._limiter()
+        for _ in range(3):
+            limiter.allow("a")
+        self.assertFalse(limiter.allow("a"))
+        self.now += 2
+        self.assertEqual([limiter.allow("a") for _ in range(3)], [True, True, False])
+
+
+class EnforceRateLimitTest(unittest.TestCase):
+    """The FastAPI dependency answers 429 once the client's bucket is empty"""
+
+    def _request(self, host):
+        return SimpleNamespace(client=SimpleNamespace(host=host))
+
+    def test_rejects_with_429(self):
+        limiter = RateLimiter(rate_per_minute=60, burst=1)
+        with mock.patch.object(rate_limiter_module, "rate_limiter", limiter):
+            asyncio.run(enforce_rate_limit(self._request("10.0.0.1")))
+            with self.assertRaises(HTTPException) as raised:
+                asyncio.run(enforce_rate_limit(self._request("10.0.0.1")))
+            # Another address still gets through
+            asyncio.run(enforce_rate_limit(self._request("10.0.0.2")))
+
+        self.assertEqual(raised.exception.status_code, 429)
+        self.assertIn("Rate limit exceeded", raised.exception.detail)
+
+
+if __name__ == "__main__":
+    unittest.main()
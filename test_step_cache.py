@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the agent step cache
+"""
+
+import unittest
+from unittest import mock
+
+from config.agent_config import PROCESS_CONFIG
+from core.step_cache import StepCache
+
+INPUTS = {
+    "source_text": "Hello",
+    "target_language": "swedish",
+    "initial_translation": "Hej",
+    "cultural_analysis": {"cultural_appropriateness": "high"},
+    "quality_mode": "balanced",
+}
+
+
+class StepCacheKeyTest(unittest.TestCase):
+    def test_key_depends_only_on_listed_inputs(self):
+        cache = StepCache()
+        key = cache.make_key("translator", INPUTS)
+        # translator is keyed on source text and language only
+        self.assertEqual(key, cache.make_key("translator", {**INPUTS, "quality_mode": "quality"}))
+        self.assertNotEqual(key, cache.make_key("translator", {**INPUTS, "source_text": "Bye"}))
+
+    def test_steps_do_not_share_keys(self):
+        cache = StepCache()
+        self.assertNotEqual(cache.make_key("reviewer", INPUTS), cache.make_key("fused_review_quality", INPUTS))
+
+    def test_uncached_step_has_no_key(self):
+        self.assertIsNone(StepCache().make_key("iso_standards", INPUTS))
+
+    def test_key_fields_change_invalidates_keys(self):
+        old_key = StepCache().make_key("translator", INPUTS)
+
+        step_cache_keys = {
+            **PROCESS_CONFIG["step_cache_keys"],
+            "translator": ("source_text", "target_language", "quality_mode"),
+        }
+        with mock.patch.dict(PROCESS_CONFIG, {"step_cache_keys": step_cache_keys}):
+            cache = StepCache()
+        self.assertNotEqual(cache.make_key("translator", INPUTS), old_key)
+        self.assertNotEqual(
+            cache.make_key("translator", INPUTS),
+            cache.make_key("translator", {**INPUTS, "quality_mode": "quality"}),
+        )
+
+    def test_step_removed_from_config_is_not_cached(self):
+        step_cache_keys = dict(PROCESS_CONFIG["step_cache_keys"])
+        del step_cache_keys["translator"]
+        with mock.patch.dict(PROCESS_CONFIG, {"step_cache_keys": step_cache_keys}):
+            cache = StepCache()
+        self.assertIsNone(cache.make_key("translator", INPUTS))
+
+
+class StepCacheStorageTest(unittest.TestCase):
+    def test_is_complete_checks_required_keys(self):
+        cache = StepCache()
+        self.assertTrue(cache.is_complete("translator", {"translation": "Hej", "confidence": 90}))
+        self.assertFalse(cache.is_complete("translator", {"translation": "Hej"}))
+        self.assertFalse(cache.is_complete("translator", None))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = StepCache(maxsize=2)
+        cache.set("a", {"n": 1})
+        cache.set("b", {"n": 2})
+        cache.get("a")
+        cache.set("c", {"n": 3})
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"n": 1})
+        self.assertEqual(cache.get("c"), {"n": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,9 +5,22 @@ Test script to verify the translation fix for medical disclaimers
 
 import asyncio
 import json
+import re
 from core.translation_service import TranslationService
 from api.models import TranslationRequest, LanguageCode
 
+# Disclaimer phrases that must not appear unless they are in the source
+UNWANTED_PHRASES = [
+    "Endast för hälso- och sjukvårdspersonal",
+    "Biverkningar ska rapporteras",
+    "Läkemedelsverket",
+    "FASS.se",
+    "medicinsk information",
+    "produktresumé",
+    "varningar och försiktighet"
+]
+UNWANTED_RE = re.compile("|".join(map(re.escape, UNWANTED_PHRASES)), re.IGNORECASE)
+
 async def test_medical_translation():
     """Test the medical text translation to ensure no disclaimers are added"""
     
@@ -44,21 +57,10 @@ async def test_medical_translation():
         print(f"Translation: {final_translation}")
         print("\n" + "="*80 + "\n")
         
-        # Check for unwanted disclaimers
-        unwanted_phrases = [
-            "Endast för hälso- och sjukvårdspersonal",
-            "Biverkningar ska rapporteras",
-            "Läkemedelsverket",
-            "FASS.se",
-            "medicinsk information",
-            "produktresumé",
-            "varningar och försiktighet"
-        ]
-        
-        found_unwanted = []
-        for phrase in unwanted_phrases:
-            if phrase.lower() in final_translation.lower():
-                found_unwanted.append(phrase)
+        # Check for unwanted disclaimers in one pass over the translation
+        found_unwanted = list(dict.fromkeys(
+            match.lower() for match in UNWANTED_RE.findall(final_translation)
+        ))
         
         if found_unwanted:
             print("❌ ISSUE FOUND: Unwanted disclaimers detected!")
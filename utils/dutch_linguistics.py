@@ -1,4 +1,5 @@
 import re
+from collections import Counter
 from typing import Dict, List, Tuple
 
 class DutchLinguistics:
@@ -20,9 +21,9 @@ class DutchLinguistics:
         
         # Dutch verb conjugation patterns
         self.verb_groups = {
-            'weak_verbs': r'\w+(de|te|d|t)$',     # werkte, maakte, heeft gewerkt
-            'strong_verbs': r'\w+en$',            # lopen, geven, nemen
-            'irregular_verbs': r'\w+(ben|is|zijn|heeft|hadden)$'  # zijn, hebben
+            'weak_verbs': r'\w+(?:de|te|d|t)',     # werkte, maakte, heeft gewerkt
+            'strong_verbs': r'\w+en',            # lopen, geven, nemen
+            'irregular_verbs': r'\w+(?:ben|is|zijn|heeft|hadden)'  # zijn, hebben
         }
         
         # Dutch vowel patterns
@@ -44,38 +45,61 @@ class DutchLinguistics:
             'past_participles': ['ge-'],                      # gedaan, gegeven
             'separable_verbs': ['af-', 'aan-', 'uit-', 'op-', 'mee-']  # afmaken, uitgaan
         }
+        
+        # Compiled once so the analyzers scan the text in a single regex pass
+        # One named group per verb group, tried in the order above; the
+        # matching group's name says where the word belongs
+        self._verb_re = re.compile(
+            r'\b(?:%s)\b' % '|'.join(
+                f'(?P<{group}>{pattern})' for group, pattern in self.verb_groups.items()
+            ),
+            re.IGNORECASE,
+        )
+        self._compound_re = re.compile('|'.join(self.compound_patterns), re.IGNORECASE)
+        self._diminutive_re = re.compile(
+            r'\b\w+(?:%s)\b' % '|'.join(s.lstrip('-') for s in self.dutch_features['diminutives']),
+            re.IGNORECASE,
+        )
+        self._separable_re = re.compile(
+            r'\b(?:%s)\w+' % '|'.join(p.rstrip('-') for p in self.dutch_features['separable_verbs']),
+            re.IGNORECASE,
+        )
+        # A sentence is any run between terminators that isn't just whitespace
+        self._sentence_re = re.compile(r'[^.!?]*[^.!?\s]')
+        self._register_res = {
+            register: re.compile(
+                r'\b(?:%s)\b' % '|'.join(
+                    re.escape(marker) for marker in sorted({m.lower() for m in markers}, key=len, reverse=True)
+                ),
+                re.IGNORECASE,
+            )
+            for register, markers in self.register_markers.items()
+        }
+    
+    def _tokenize(self, text: str) -> Tuple[List[str], List[str]]:
+        """Split text into words once, along with their lowercased forms"""
+        # One lower() over the whole text instead of one per word
+        return text.split(), text.lower().split()
     
     def analyze_definite_articles(self, text: str) -> Dict:
         """Analyze definite article usage in Dutch text"""
-        analysis = {
-            'de_articles': 0,
-            'het_articles': 0,
+        return self._definite_articles_from_tokens(self._tokenize(text)[1])
+    
+    def _definite_articles_from_tokens(self, lower_words: List[str]) -> Dict:
+        counts = Counter(lower_words)
+        return {
+            'de_articles': counts['de'],
+            'het_articles': counts['het'],
             'article_errors': []
         }
-        
-        words = text.split()
-        
-        for i, word in enumerate(words):
-            word_lower = word.lower()
-            if word_lower == 'de':
-                analysis['de_articles'] += 1
-            elif word_lower == 'het':
-                analysis['het_articles'] += 1
-        
-        return analysis
     
     def detect_compounds(self, text: str) -> List[str]:
         """Detect Dutch compound words"""
-        compounds = []
-        
-        for pattern in self.compound_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            compounds.extend(matches)
-        
-        # Remove duplicates and filter by length
-        compounds = list(set([c for c in compounds if len(c) > 6]))
-        
-        return compounds
+        # Deduplicated (in order of appearance) and length-filtered in one pass
+        return list(dict.fromkeys(
+            match.group() for match in self._compound_re.finditer(text)
+            if match.end() - match.start() > 6
+        ))
     
     def analyze_verb_conjugation(self, text: str) -> Dict:
         """Analyze Dutch verb conjugation patterns"""
@@ -86,17 +110,8 @@ class DutchLinguistics:
             'total_verbs': 0
         }
         
-        words = text.split()
-        
-        for word in words:
-            word_lower = word.lower()
-            
-            if re.match(self.verb_groups['weak_verbs'], word_lower):
-                analysis['weak_verbs'].append(word)
-            elif re.match(self.verb_groups['strong_verbs'], word_lower):
-                analysis['strong_verbs'].append(word)
-            elif re.match(self.verb_groups['irregular_verbs'], word_lower):
-                analysis['irregular_verbs'].append(word)
+        for match in self._verb_re.finditer(text):
+            analysis[match.lastgroup].append(match.group())
         
         analysis['total_verbs'] = sum(len(verbs) for verbs in analysis.values() if isinstance(verbs, list))
         
@@ -104,12 +119,9 @@ class DutchLinguistics:
     
     def detect_register(self, text: str) -> str:
         """Detect formal/informal register in Dutch text"""
-        text_lower = text.lower()
-        
-        formal_count = sum(1 for marker in self.register_markers['formal'] 
-                          if marker.lower() in text_lower)
-        informal_count = sum(1 for marker in self.register_markers['informal'] 
-                           if marker.lower() in text_lower)
+        # Whole-word matches only: a bare substring test counted the "u" in "uit"
+        formal_count = len(self._register_res['formal'].findall(text))
+        informal_count = len(self._register_res['informal'].findall(text))
         
         if formal_count > informal_count:
             return 'formal'
@@ -120,29 +132,11 @@ class DutchLinguistics:
     
     def detect_diminutives(self, text: str) -> List[str]:
         """Detect Dutch diminutive forms"""
-        diminutives = []
-        words = text.split()
-        
-        for word in words:
-            for suffix in self.dutch_features['diminutives']:
-                if word.lower().endswith(suffix):
-                    diminutives.append(word)
-                    break
-        
-        return diminutives
+        return self._diminutive_re.findall(text)
     
     def analyze_separable_verbs(self, text: str) -> List[str]:
         """Detect Dutch separable verbs"""
-        separable_verbs = []
-        words = text.split()
-        
-        for word in words:
-            for prefix in self.dutch_features['separable_verbs']:
-                if word.lower().startswith(prefix):
-                    separable_verbs.append(word)
-                    break
-        
-        return separable_verbs
+        return self._separable_re.findall(text)
     
     def validate_dutch_syntax(self, sentence: str) -> Dict:
         """Basic Dutch syntax validation"""
@@ -165,14 +159,15 @@ class DutchLinguistics:
     
     def comprehensive_analysis(self, text: str) -> Dict:
         """Perform comprehensive Dutch linguistic analysis"""
+        words, lower_words = self._tokenize(text)
         return {
-            'definite_articles': self.analyze_definite_articles(text),
+            'definite_articles': self._definite_articles_from_tokens(lower_words),
             'compounds': self.detect_compounds(text),
             'verb_analysis': self.analyze_verb_conjugation(text),
             'register': self.detect_register(text),
             'diminutives': self.detect_diminutives(text),
             'separable_verbs': self.analyze_separable_verbs(text),
-            'word_count': len(text.split()),
+            'word_count': len(words),
             'character_count': len(text),
-            'sentences': len([s for s in text.split('.') if s.strip()])
+            'sentences': sum(1 for _ in self._sentence_re.finditer(text))
         }
\ No newline at end of file